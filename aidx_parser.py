@@ -15,17 +15,106 @@ Python: 3.9+
 """
 
 # Import required standard library modules
-import xml.etree.ElementTree as ET  # For XML parsing
 import json                         # For JSON serialization
-import re                          # For regular expressions (namespace cleaning)
-from typing import Dict, Any, List, Optional, Union  # For type hints
+import os                           # For os.PathLike input handling
+import sys                          # For string interning of output keys
+from typing import Dict, Any, Iterable, List, Optional, Union  # For type hints
 from pathlib import Path           # For file path handling
+from concurrent.futures import ProcessPoolExecutor  # For parallel batch parsing
+from functools import partial      # For binding batch parsing options
 import logging                     # For logging functionality
 
+# XML parsing backends. The standard library ElementTree is always available (on
+# CPython 3.9+ it uses the C accelerator automatically). lxml (libxml2-based) is
+# several times faster on large AIDX payloads and exposes the same Element API
+# ({namespace}tag names, .attrib, .text), so it is preferred when installed.
+import xml.etree.ElementTree as _stdlib_et  # For XML parsing (standard library)
+try:
+    import lxml.etree as _lxml_et   # For XML parsing (libxml2, optional)
+except ImportError:                 # pragma: no cover - depends on environment
+    _lxml_et = None
+
+# lxml before 5.0 cannot expand internal entities while refusing external ones
+# (resolve_entities='internal'), so older releases fall back to ElementTree
+if _lxml_et is not None and _lxml_et.LXML_VERSION < (5, 0):  # pragma: no cover
+    _lxml_et = None
+
+# Available backends by name, and the default used when none is requested
+_BACKENDS = {'stdlib': _stdlib_et}
+if _lxml_et is not None:
+    _BACKENDS['lxml'] = _lxml_et
+DEFAULT_BACKEND = 'lxml' if _lxml_et is not None else 'stdlib'
+
+# Default backend module (also used for Element type hints)
+ET = _BACKENDS[DEFAULT_BACKEND]
+
+# XML syntax errors raised by any available backend
+_XMLSyntaxError = ((_stdlib_et.ParseError, _lxml_et.XMLSyntaxError)
+                   if _lxml_et is not None else (_stdlib_et.ParseError,))
+
+# Use orjson (C-implemented JSON encoder) for serialization when installed
+try:
+    import orjson                   # For fast JSON serialization (optional)
+except ImportError:                 # pragma: no cover - depends on environment
+    orjson = None
+
+# Separators for compact (indent=None) JSON, matching orjson's compact output
+_COMPACT_SEPARATORS = (',', ':')
+
 # Configure logging to show INFO level messages
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Key used for element text in mixed-content results (interned: it is used as a
+# dict key for every such element)
+_TEXT_KEY = sys.intern('#text')
+
+# Maximum number of distinct tag names memoized per parser instance; bounds memory
+# when a long-lived parser sees documents with arbitrary (untrusted) tag names
+_TAG_CACHE_LIMIT = 4096
+
+
+def _local_name(tag: str) -> str:
+    """
+    Strip the namespace prefix from an ElementTree/lxml name.
+    
+    Names have the form {namespace-uri}localname, so the local name is everything
+    after the last closing brace.
+    
+    Args:
+        tag: Raw tag or attribute name
+        
+    Returns:
+        Name without namespace prefix
+    """
+    return tag.rpartition('}')[2] if tag[0] == '{' else tag
+
+
+def _new_xml_parser(encoding: Optional[str] = None):
+    """
+    Create an lxml XMLParser configured for AIDX documents.
+    
+    Comments and processing instructions are dropped (matching ElementTree's
+    default behaviour). Entities declared in the document's internal DTD subset
+    are expanded like ElementTree does, while external entities are refused (a
+    reference to one is a syntax error on both backends) and network access is
+    disabled, so uploaded documents cannot pull in external resources.
+    Whitespace-only text between elements (indentation) is never output, so
+    libxml2 discards it while parsing instead of allocating it.
+    
+    Args:
+        encoding: Override the document encoding (used for already-decoded strings)
+        
+    Returns:
+        lxml XMLParser instance
+    """
+    return _lxml_et.XMLParser(encoding=encoding,
+                              remove_comments=True,
+                              remove_pis=True,
+                              remove_blank_text=True,
+                              resolve_entities='internal',
+                              no_network=True)
+
 
 class AIDXParseError(Exception):
     """
@@ -60,7 +149,8 @@ class AIDXParser:
                  skip_tags: Optional[List[str]] = None,
                  include_only_tags: Optional[List[str]] = None,
                  preserve_namespaces: bool = False,
-                 include_attributes: bool = True):
+                 include_attributes: bool = True,
+                 backend: Optional[str] = None):
         """
         Initialize the AIDX parser with configuration options.
         
@@ -73,6 +163,11 @@ class AIDXParser:
                                False (default) = cleaner output, True = full XML fidelity
             include_attributes: Whether to include XML attributes in output
                               True (default) = full data preservation
+            backend: XML parsing backend, 'lxml' or 'stdlib' (ElementTree)
+                    None (default) = lxml when installed, otherwise stdlib
+        
+        Raises:
+            ValueError: If the requested backend is unknown or not installed
         
         Example:
             # Skip TPA extensions for cleaner output
@@ -82,17 +177,48 @@ class AIDXParser:
             parser = AIDXParser(include_only_tags=['FlightLeg'])
         """
         # Store configuration options for use during parsing
-        self.skip_tags = skip_tags or []           # Tags to exclude from parsing
-        self.include_only_tags = include_only_tags # Tags to include (exclusive filter)
+        # Tag filters are stored as frozensets for O(1) membership checks
+        self.skip_tags = frozenset(skip_tags or ())  # Tags to exclude from parsing
+        self.include_only_tags = (frozenset(include_only_tags)  # Tags to include (exclusive filter)
+                                  if include_only_tags else None)
         self.preserve_namespaces = preserve_namespaces  # Namespace handling preference
         self.include_attributes = include_attributes    # Attribute inclusion preference
         
-        # Log the parser configuration for debugging
-        logger.info(f"AIDX Parser initialized with config: "
-                   f"skip_tags={self.skip_tags}, "
-                   f"include_only_tags={self.include_only_tags}, "
-                   f"preserve_namespaces={self.preserve_namespaces}, "
-                   f"include_attributes={self.include_attributes}")
+        # Select the XML backend module
+        self.backend = backend or DEFAULT_BACKEND
+        if self.backend not in _BACKENDS:
+            raise ValueError(f"XML backend {self.backend!r} is not available "
+                             f"(available: {', '.join(sorted(_BACKENDS))})")
+        self._et = _BACKENDS[self.backend]
+        
+        # lxml parser instances (None for the ElementTree backend).
+        # Strings are re-encoded as UTF-8, so their parser ignores the declared encoding.
+        if self.backend == 'lxml':
+            self._xml_parser = _new_xml_parser()
+            self._xml_str_parser = _new_xml_parser(encoding='utf-8')
+        else:
+            self._xml_parser = None
+            self._xml_str_parser = None
+        
+        # Per-parser memos keyed by raw tag name. AIDX documents repeat the same few
+        # dozen tags thousands of times, so each is cleaned and filtered only once.
+        self._clean_cache: Dict[str, str] = {}     # raw tag -> cleaned tag
+        self._tag_cache: Dict[Any, str] = {}       # raw child tag -> cleaned tag, '' if skipped
+        self._attr_key_cache: Dict[str, str] = {}  # raw attribute name -> '@name' output key
+        
+        # Without attributes or filters, use the specialized element walker
+        if not include_attributes and not self.skip_tags and self.include_only_tags is None:
+            self._parse_element = self._parse_element_fast
+        
+        # Log the parser configuration for debugging (only built when INFO is enabled)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("AIDX Parser initialized with config: "
+                        "skip_tags=%s, include_only_tags=%s, "
+                        "preserve_namespaces=%s, include_attributes=%s",
+                        sorted(self.skip_tags),
+                        sorted(self.include_only_tags) if self.include_only_tags else None,
+                        self.preserve_namespaces,
+                        self.include_attributes)
 
     def _clean_tag_name(self, tag: str) -> str:
         """
@@ -112,15 +238,28 @@ class AIDXParser:
             Input:  "{http://www.iata.org/IATA/2007/00}IATA_AIDX_FlightLegNotifRQ"
             Output: "IATA_AIDX_FlightLegNotifRQ"
         """
+        # Fast path: tag already seen by this parser
+        clean_tag = self._clean_cache.get(tag)
+        if clean_tag is not None:
+            return clean_tag
+        
         if self.preserve_namespaces:
             # Return tag as-is if namespace preservation is requested
-            return tag
+            clean_tag = tag
+        else:
+            # Remove namespace URI in curly braces: {namespace}tagname -> tagname
+            clean_tag = _local_name(tag)
         
-        # Use regex to remove namespace URI in curly braces: {namespace}tagname -> tagname
-        # Pattern explanation: {.*?} matches {anything} non-greedily
-        return re.sub(r'\{.*?\}', '', tag)
+        # Intern the name: it becomes a key in every result dict for this tag, so
+        # lookups with interned (or literal) names compare by identity
+        clean_tag = sys.intern(clean_tag)
+        
+        # Memoize the result (up to the cache limit)
+        if len(self._clean_cache) < _TAG_CACHE_LIMIT:
+            self._clean_cache[tag] = clean_tag
+        return clean_tag
 
-    def _should_process_tag(self, tag: str) -> bool:
+    def _should_process_clean(self, clean_tag: str) -> bool:
         """
         Determine whether a specific XML tag should be processed based on filter settings.
         
@@ -130,23 +269,20 @@ class AIDXParser:
         3. Otherwise, process all tags
         
         Args:
-            tag: Cleaned tag name to check
+            clean_tag: Cleaned tag name to check (see _clean_tag_name)
             
         Returns:
             True if tag should be processed, False if it should be skipped
             
         Example:
             # With skip_tags=['TPA_Extension']
-            _should_process_tag('FlightLeg') -> True
-            _should_process_tag('TPA_Extension') -> False
+            _should_process_clean('FlightLeg') -> True
+            _should_process_clean('TPA_Extension') -> False
             
             # With include_only_tags=['FlightLeg']
-            _should_process_tag('FlightLeg') -> True
-            _should_process_tag('Originator') -> False
+            _should_process_clean('FlightLeg') -> True
+            _should_process_clean('Originator') -> False
         """
-        # Clean the tag name for consistent comparison
-        clean_tag = self._clean_tag_name(tag)
-        
         # If include_only_tags is specified, only process tags in that list
         if self.include_only_tags:
             return clean_tag in self.include_only_tags
@@ -158,17 +294,75 @@ class AIDXParser:
         # Default: process all tags
         return True
 
+    def _resolve_tag(self, tag: Any) -> str:
+        """
+        Resolve a raw child tag to its output key in a single memoized lookup.
+        
+        Combines the filter check and the tag cleaning that every child element
+        needs, so the hot loop in _parse_element does one dict lookup per child
+        instead of two method calls.
+        
+        Args:
+            tag: Raw tag of a child node (non-string for comments/PIs/entities in lxml)
+            
+        Returns:
+            Cleaned tag name, or an empty string if the child should be skipped
+            
+        Example:
+            # With skip_tags=['TPA_Extension']
+            _resolve_tag('{http://www.iata.org/IATA/2007/00}FlightLeg') -> 'FlightLeg'
+            _resolve_tag('{http://www.iata.org/IATA/2007/00}TPA_Extension') -> ''
+        """
+        # Comments, processing instructions and unresolved entities are never output
+        if not isinstance(tag, str):
+            resolved = ""
+        else:
+            # Clean the tag once, then filter on the cleaned name
+            resolved = self._clean_tag_name(tag)
+            if not self._should_process_clean(resolved):
+                resolved = ""
+        
+        # Memoize the result (up to the cache limit)
+        if len(self._tag_cache) < _TAG_CACHE_LIMIT:
+            self._tag_cache[tag] = resolved
+        return resolved
+
+    def _attr_key(self, attr_name: str) -> str:
+        """
+        Build (and memoize) the output key for an XML attribute name.
+        
+        Keys are interned so the many result dicts sharing them hash and compare
+        by identity.
+        
+        Args:
+            attr_name: Raw attribute name with potential namespace prefix
+            
+        Returns:
+            Cleaned attribute name with @ prefix (e.g. '@CodeContext')
+        """
+        key = sys.intern('@' + self._clean_tag_name(attr_name))
+        
+        # Memoize the key (up to the cache limit)
+        if len(self._attr_key_cache) < _TAG_CACHE_LIMIT:
+            self._attr_key_cache[attr_name] = key
+        return key
+
     def _parse_element(self, element: ET.Element) -> Union[Dict[str, Any], str, List[Any]]:
         """
-        Recursively parse an XML element and its children into a Python data structure.
+        Parse an XML element and all its descendants into a Python data structure.
         
         This is the core parsing method that handles:
         - Element attributes (stored with @ prefix)
         - Text content (stored as #text key)
-        - Child elements (recursively parsed)
+        - Child elements (parsed depth-first)
         - Repeating elements (converted to lists)
         - Mixed content (text + child elements)
         
+        The tree is walked with an explicit stack rather than recursion, so deeply
+        nested documents cannot hit Python's recursion limit and no interpreter frame
+        is set up per element. Each element is converted once all of its children
+        have been converted (post-order).
+        
         Args:
             element: XML element to parse
             
@@ -199,83 +393,205 @@ class AIDXParser:
                 }
             }
         """
-        # Initialize result dictionary to store parsed data
-        result = {}
-        
-        # Step 1: Process XML attributes if attribute inclusion is enabled
-        if self.include_attributes and element.attrib:
-            # Add attributes with @ prefix to distinguish from child elements
-            for attr_name, attr_value in element.attrib.items():
-                # Clean attribute names to remove namespace prefixes
-                clean_attr_name = self._clean_tag_name(attr_name)
-                result[f"@{clean_attr_name}"] = attr_value
-        
-        # Step 2: Process text content
-        # Get direct text content (not including text from child elements)
-        text_content = element.text.strip() if element.text else ""
-        
-        # Step 3: Process child elements
-        # Group children by tag name to handle repeating elements
-        children_by_tag = {}
-        
-        for child in element:
-            # Clean the child tag name
-            clean_child_tag = self._clean_tag_name(child.tag)
-            
-            # Skip this child if it doesn't pass the filter
-            if not self._should_process_tag(child.tag):
-                continue
-            
-            # Recursively parse the child element
-            child_data = self._parse_element(child)
-            
-            # Group children by tag name to detect repeating elements
-            if clean_child_tag not in children_by_tag:
-                children_by_tag[clean_child_tag] = []
-            children_by_tag[clean_child_tag].append(child_data)
-        
-        # Step 4: Add child elements to result
-        for tag_name, child_list in children_by_tag.items():
-            if len(child_list) == 1:
-                # Single occurrence: add directly
-                result[tag_name] = child_list[0]
+        # Bind hot attributes and methods to locals once per call; the loop below runs
+        # once per element and local lookups are much cheaper than attribute lookups
+        attr_key_get = self._attr_key_cache.get
+        attr_key = self._attr_key
+        tag_cache_get = self._tag_cache.get
+        resolve_tag = self._resolve_tag
+        include_attributes = self.include_attributes
+        
+        # Stack of open elements. Each frame holds:
+        # (element, iterator over its children, result dict being filled, tag in parent)
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        
+        # Element to open next, and its output key in the parent's result
+        next_element, next_tag = element, None
+        
+        while True:
+            if next_element is not None:
+                # Step 1: Open the element; its attributes come first in its result
+                result = {}
+                
+                # Process XML attributes if attribute inclusion is enabled
+                if include_attributes and next_element.attrib:
+                    # Add attributes with @ prefix to distinguish from child elements
+                    for attr_name, attr_value in next_element.attrib.items():
+                        # Clean attribute names to remove namespace prefixes (memoized)
+                        key = attr_key_get(attr_name)
+                        if key is None:
+                            key = attr_key(attr_name)
+                        result[key] = attr_value
+                
+                push((next_element, iter(next_element), result, next_tag))
+                next_element = None
+            
+            current, children, result, parent_tag = stack[-1]
+            
+            # Step 2: Descend into the next child that passes the filters
+            for child in children:
+                # Resolve the output key once per distinct tag ('' = filtered out,
+                # comment, processing instruction or unresolved entity)
+                child_tag = tag_cache_get(child.tag)
+                if child_tag is None:
+                    child_tag = resolve_tag(child.tag)
+                if not child_tag:
+                    continue
+                
+                # Parse the child before continuing with its siblings
+                next_element, next_tag = child, child_tag
+                break
             else:
-                # Multiple occurrences: create list
-                result[tag_name] = child_list
-        
-        # Step 5: Handle text content
-        if text_content:
-            if result:
-                # Mixed content: element has both text and children/attributes
-                # Store text content with special #text key
-                result["#text"] = text_content
+                # All children are parsed and already stored in result
+                pop()
+                
+                # Step 3: Handle text content
+                # Get direct text content (not including text from child elements)
+                text_content = current.text.strip() if current.text else ""
+                if text_content:
+                    if result:
+                        # Mixed content: element has both text and children/attributes
+                        # Store text content with special #text key
+                        result[_TEXT_KEY] = text_content
+                    else:
+                        # Text-only element: the value is just the text
+                        result = text_content
+                elif not result:
+                    # Empty element: the value is an empty string
+                    result = ""
+                
+                # Step 4: Hand the result to the parent, or return it for the top element
+                if not stack:
+                    return result
+                
+                # Store directly in the parent: the first occurrence of a tag is kept
+                # as-is, a second one turns the entry into a list (element values are
+                # never lists themselves, so a list always means a repeated tag)
+                parent_result = stack[-1][2]
+                existing = parent_result.get(parent_tag)
+                if existing is None:
+                    # Single occurrence: add directly
+                    parent_result[parent_tag] = result
+                elif type(existing) is list:
+                    # Third and later occurrences: extend the list
+                    existing.append(result)
+                else:
+                    # Second occurrence: create list
+                    parent_result[parent_tag] = [existing, result]
+
+    def _parse_element_fast(self, element: ET.Element) -> Union[Dict[str, Any], str, List[Any]]:
+        """
+        Specialized _parse_element() for parsers without attributes or filters.
+        
+        Bound in place of _parse_element() by __init__ when include_attributes is
+        False and no skip_tags/include_only_tags are set. With no attributes to copy
+        and nothing to filter, leaf elements (the vast majority in AIDX documents)
+        are converted straight into their parent's result without a stack frame.
+        The output is identical to _parse_element() for the same configuration.
+        
+        Args:
+            element: XML element to parse
+            
+        Returns:
+            Parsed data structure (see _parse_element)
+        """
+        # Bind hot methods to locals once per call
+        tag_cache_get = self._tag_cache.get
+        resolve_tag = self._resolve_tag
+        
+        # Stack frames: (element, iterator over its children, result dict, tag in parent)
+        stack = [(element, iter(element), {}, None)]
+        push = stack.append
+        pop = stack.pop
+        
+        while True:
+            current, children, result, parent_tag = stack[-1]
+            
+            for child in children:
+                # Resolve the output key ('' = comment, processing instruction or entity)
+                child_tag = tag_cache_get(child.tag)
+                if child_tag is None:
+                    child_tag = resolve_tag(child.tag)
+                if not child_tag:
+                    continue
+                
+                if len(child):
+                    # Element with children: parse it before continuing with its siblings
+                    push((child, iter(child), {}, child_tag))
+                    break
+                
+                # Leaf element: its value is just its text
+                text = child.text
+                value = text.strip() if text else ""
+                existing = result.get(child_tag)
+                if existing is None:
+                    result[child_tag] = value
+                elif type(existing) is list:
+                    existing.append(value)
+                else:
+                    result[child_tag] = [existing, value]
             else:
-                # Text-only element: return just the text
-                return text_content
-        
-        # Step 6: Return appropriate data structure
-        if not result:
-            # Empty element: return empty string
-            return ""
-        elif len(result) == 1 and "#text" in result:
-            # Element with only text content: return the text
-            return result["#text"]
-        else:
-            # Element with attributes, children, or mixed content: return dictionary
-            return result
+                # All children are parsed and already stored in result
+                pop()
+                
+                # Handle text content exactly as _parse_element() does
+                text_content = current.text.strip() if current.text else ""
+                if text_content:
+                    if result:
+                        result[_TEXT_KEY] = text_content
+                    else:
+                        result = text_content
+                elif not result:
+                    result = ""
+                
+                # Hand the result to the parent, or return it for the top element
+                if not stack:
+                    return result
+                parent_result = stack[-1][2]
+                existing = parent_result.get(parent_tag)
+                if existing is None:
+                    parent_result[parent_tag] = result
+                elif type(existing) is list:
+                    existing.append(result)
+                else:
+                    parent_result[parent_tag] = [existing, result]
 
-    def parse_xml_string(self, xml_string: str) -> Dict[str, Any]:
+    def _parse_root(self, root: ET.Element) -> Dict[str, Any]:
+        """
+        Convert a parsed root element into the top-level result dictionary.
+        
+        Shared by the string and file entry points once the XML backend has
+        produced an Element tree.
+        
+        Args:
+            root: Root element of the parsed document
+            
+        Returns:
+            Dictionary with the cleaned root tag as its only key
+        """
+        # Log successful parsing with root element info
+        clean_root_tag = self._clean_tag_name(root.tag)
+        logger.info("Successfully parsed XML with root element: %s", root.tag)
+        
+        # Return data wrapped in dictionary with root tag as key
+        # This maintains the XML structure where there's always a root element
+        return {clean_root_tag: self._parse_element(root)}
+
+    def parse_xml_string(self, xml_string: Union[str, bytes]) -> Dict[str, Any]:
         """
         Parse an AIDX XML string into a Python dictionary.
         
         This method:
         1. Validates the XML string is not empty
-        2. Parses the XML using ElementTree
+        2. Parses the XML using lxml (or ElementTree as a fallback)
         3. Processes the root element and all children
         4. Returns a dictionary with the root element as the top-level key
         
         Args:
-            xml_string: Valid XML string containing AIDX data
+            xml_string: Valid XML string containing AIDX data. Bytes are passed
+                        to parse_xml_bytes()
             
         Returns:
             Dictionary with parsed XML data
@@ -292,36 +608,118 @@ class AIDXParser:
             result = parser.parse_xml_string(xml_data)
             # Returns: {"IATA_AIDX_FlightLegNotifRQ": {...}}
         """
+        # Raw bytes go straight to the parser without any decoding
+        if isinstance(xml_string, bytes):
+            return self.parse_xml_bytes(xml_string)
+        
         # Validate input
         if not xml_string or not xml_string.strip():
             raise AIDXParseError("XML string cannot be empty")
         
         try:
-            # Parse XML string using ElementTree
-            # fromstring() creates an Element object from the XML string
-            root = ET.fromstring(xml_string)
+            # Parse XML string into an Element tree
+            if self._xml_parser is None:
+                root = self._et.fromstring(xml_string)
+            else:
+                # lxml rejects str input carrying an encoding declaration, so hand it UTF-8 bytes
+                root = self._et.fromstring(xml_string.encode('utf-8'), self._xml_str_parser)
+            
+            # Parse the root element and all its children
+            return self._parse_root(root)
             
-            # Log successful parsing with root element info
-            clean_root_tag = self._clean_tag_name(root.tag)
-            logger.info(f"Successfully parsed XML with root element: {root.tag}")
+        except Exception as e:
+            # Translate XML syntax and unexpected errors into AIDXParseError
+            raise self._content_error(e) from e
+
+    def parse_xml_bytes(self, xml_bytes: bytes) -> Dict[str, Any]:
+        """
+        Parse raw AIDX XML bytes (e.g. a file or request body) into a Python dictionary.
+        
+        The bytes are handed to the C parser as they are; the document's XML
+        declaration determines the encoding, so there is no decode to str and no
+        re-encode on the way in.
+        
+        Args:
+            xml_bytes: Raw XML document bytes
+            
+        Returns:
+            Dictionary with parsed XML data
+            
+        Raises:
+            AIDXParseError: If XML parsing fails or the input is empty
+            
+        Example:
+            result = parser.parse_xml_bytes(Path("flight.xml").read_bytes())
+            # Returns: {"IATA_AIDX_FlightLegNotifRQ": {...}}
+        """
+        # Validate input
+        if not xml_bytes or not xml_bytes.strip():
+            raise AIDXParseError("XML string cannot be empty")
+        
+        try:
+            # Parse the bytes into an Element tree
+            if self._xml_parser is None:
+                root = self._et.fromstring(xml_bytes)
+            else:
+                root = self._et.fromstring(xml_bytes, self._xml_parser)
             
             # Parse the root element and all its children
-            parsed_data = self._parse_element(root)
+            return self._parse_root(root)
+            
+        except Exception as e:
+            # Translate XML syntax and unexpected errors into AIDXParseError
+            raise self._content_error(e) from e
+
+    def parse_xml_stream(self, chunks: Iterable[bytes]) -> Dict[str, Any]:
+        """
+        Parse AIDX XML delivered in chunks (e.g. an upload being read from a socket).
+        
+        Each chunk is fed to the XML parser as soon as it is available, so parsing
+        overlaps with reading and the raw document is never joined into a single
+        string. The result is identical to parse_xml_string() on the joined bytes.
+        
+        Args:
+            chunks: Iterable of raw XML byte chunks, in document order. The XML
+                    declaration determines the encoding
+            
+        Returns:
+            Dictionary with parsed XML data
+            
+        Raises:
+            AIDXParseError: If XML parsing fails or the stream is empty
+            
+        Example:
+            with open("flight.xml", "rb") as f:
+                result = parser.parse_xml_stream(iter(lambda: f.read(65536), b""))
+        """
+        # Each call gets its own feed parser: feeding is stateful, and a fresh
+        # parser keeps concurrent streams on a shared AIDXParser independent
+        if self.backend == 'lxml':
+            feed_parser = _new_xml_parser()
+        else:
+            feed_parser = self._et.XMLParser()
+        
+        try:
+            # Feed the document chunk by chunk, remembering whether any content arrived
+            has_content = False
+            for chunk in chunks:
+                if not has_content and chunk.strip():
+                    has_content = True
+                feed_parser.feed(chunk)
+            
+            # Validate input
+            if not has_content:
+                raise AIDXParseError("XML string cannot be empty")
             
-            # Return data wrapped in dictionary with root tag as key
-            # This maintains the XML structure where there's always a root element
-            return {clean_root_tag: parsed_data}
+            # Finish parsing; close() returns the root element
+            return self._parse_root(feed_parser.close())
             
-        except ET.ParseError as e:
-            # Handle XML parsing errors (malformed XML, syntax errors, etc.)
-            error_msg = f"Failed to parse XML: {str(e)}"
-            logger.error(error_msg)
-            raise AIDXParseError(error_msg) from e
+        except AIDXParseError:
+            # Re-raise our custom errors without modification
+            raise
         except Exception as e:
-            # Handle any other unexpected errors
-            error_msg = f"Unexpected error during XML parsing: {str(e)}"
-            logger.error(error_msg)
-            raise AIDXParseError(error_msg) from e
+            # Translate XML syntax and unexpected errors into AIDXParseError
+            raise self._content_error(e) from e
 
     def parse_xml_file(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -329,8 +727,8 @@ class AIDXParser:
         
         This method:
         1. Validates the file exists and is readable
-        2. Reads the file content with UTF-8 encoding
-        3. Delegates to parse_xml_string() for actual parsing
+        2. Parses the file directly (the XML declaration determines the encoding)
+        3. Processes the root element and all children
         4. Provides detailed error handling for file operations
         
         Args:
@@ -350,50 +748,237 @@ class AIDXParser:
         file_path = Path(file_path)
         
         try:
-            # Validate file exists
-            if not file_path.exists():
-                raise AIDXParseError(f"File not found: {file_path}")
+            # Validate the path points at a readable file
+            self._validate_file_path(file_path)
+            
+            # Let the XML parser read the file itself: bytes stream straight into the
+            # C parser in small buffers without first being copied into a Python string.
+            # (An mmap would not help here: lxml/expat need a bytes copy of the mapping,
+            # whereas reading by path never holds the whole raw document in memory.)
+            if self._xml_parser is not None:
+                root = self._et.parse(str(file_path), self._xml_parser).getroot()
+            else:
+                root = self._et.parse(str(file_path)).getroot()
+            
+            # Log successful file read
+            logger.info("Successfully read XML file: %s", file_path)
+            
+            # Parse the root element and all its children
+            return self._parse_root(root)
+            
+        except AIDXParseError:
+            # Re-raise our custom errors without modification
+            raise
+        except Exception as e:
+            # Translate XML, file-system and unexpected errors into AIDXParseError
+            raise self._file_error(e, file_path) from e
+
+    def parse_xml_file_streaming(self, file_path: Union[str, Path],
+                                 record_tag: Optional[str] = 'FlightLeg') -> Dict[str, Any]:
+        """
+        Parse a large AIDX XML file incrementally, one record at a time.
+        
+        Instead of building the whole document tree before converting it, this method
+        streams the file through iterparse. Each completed record element (FlightLeg by
+        default) is converted with _parse_element() and its subtree is then released,
+        so memory stays proportional to a single record rather than the whole file.
+        
+        Records found anywhere in the document are collected, in document order, as a
+        list under record_tag in the root element's dictionary (even when there is only
+        one), at the position where the first record appears among the root's keys.
+        Everything else under the root is parsed exactly as parse_xml_file() does, so
+        for records that are direct children of the root the only difference is that a
+        single record is still wrapped in a list. Records inside subtrees excluded by
+        skip_tags/include_only_tags are dropped with the subtree, and records nested in
+        another record stay part of it. Excluded subtrees are discarded as soon as they
+        close instead of being held until the end of the document.
+        
+        Args:
+            file_path: Path to XML file (string or Path object)
+            record_tag: Cleaned tag name of the repeating record element.
+                        None falls back to parse_xml_file()
+            
+        Returns:
+            Dictionary with parsed XML data
+            
+        Raises:
+            AIDXParseError: If file cannot be read or parsed
+            
+        Example:
+            result = parser.parse_xml_file_streaming("flight_bundle.xml")
+            # Returns: {"IATA_AIDX_FlightLegNotifRQ": {..., "FlightLeg": [{...}, {...}]}}
+        """
+        # Without a record element there is nothing to stream; use the tree parser
+        if record_tag is None:
+            return self.parse_xml_file(file_path)
+        
+        # Convert string path to Path object for consistent handling
+        file_path = Path(file_path)
+        
+        try:
+            # Validate the path points at a readable file
+            self._validate_file_path(file_path)
+            
+            # Create the incremental parser (lxml takes the same safety options)
+            if self.backend == 'lxml':
+                events = self._et.iterparse(str(file_path), events=('start', 'end'),
+                                            remove_comments=True, remove_pis=True,
+                                            remove_blank_text=True,
+                                            resolve_entities='internal', no_network=True)
+            else:
+                events = self._et.iterparse(str(file_path), events=('start', 'end'))
             
-            # Validate it's actually a file (not a directory)
-            if not file_path.is_file():
-                raise AIDXParseError(f"Path is not a file: {file_path}")
+            # Open elements from the root down to the current one, and converted records
+            open_elements = []
+            records = []
+            root = None
+            # Output keys of the root's children that come before the first record
+            preceding_tags = None
+            # Number of open elements inside the outermost open record or filtered-out
+            # subtree (0 when there is none); those elements are handled as one unit
+            held_depth = 0
             
-            # Read file content with UTF-8 encoding
-            # UTF-8 is standard for XML files and handles international characters
-            with open(file_path, 'r', encoding='utf-8') as file:
-                xml_content = file.read()
+            for event, elem in events:
+                if event == 'start':
+                    # Remember the root and track the open element chain
+                    open_elements.append(elem)
+                    if root is None:
+                        root = elem
+                    elif held_depth:
+                        held_depth += 1
+                    else:
+                        # Resolve the output key ('' when skip_tags/include_only_tags
+                        # filter it out); records and filtered subtrees are held whole
+                        clean_tag = self._tag_cache.get(elem.tag)
+                        if clean_tag is None:
+                            clean_tag = self._resolve_tag(elem.tag)
+                        if not clean_tag or clean_tag == record_tag:
+                            held_depth = 1
+                    continue
+                
+                # 'end' event: the element and its whole subtree are complete
+                open_elements.pop()
+                if held_depth != 1:
+                    # Kept non-record element (it stays with its parent until the root
+                    # closes), the root itself, or part of a held subtree
+                    held_depth = max(held_depth - 1, 0)
+                    continue
+                held_depth = 0
+                
+                if (self._tag_cache.get(elem.tag) or self._resolve_tag(elem.tag)) == record_tag:
+                    # The root children before the one holding the first record place
+                    # the record list among the root's keys (the backend may already
+                    # have attached later siblings, so stop at that child)
+                    if preceding_tags is None:
+                        anchor = open_elements[1] if len(open_elements) > 1 else elem
+                        preceding_tags = set()
+                        for child in root:
+                            if child is anchor:
+                                break
+                            preceding_tags.add(self._resolve_tag(child.tag))
+                    # Convert the finished record and free its subtree
+                    records.append(self._parse_element(elem))
+                
+                # Records and filtered-out subtrees (e.g. TPA_Extension) are released as
+                # soon as they close, so skipped data never accumulates in memory
+                elem.clear()
+                open_elements[-1].remove(elem)
             
             # Log successful file read
-            logger.info(f"Successfully read XML file: {file_path}")
+            logger.info("Successfully streamed XML file: %s (%d %s records)",
+                        file_path, len(records), record_tag)
             
-            # Delegate to string parsing method
-            return self.parse_xml_string(xml_content)
+            # Parse what is left of the root (attributes and non-record children)
+            root_data = self._parse_element(root)
+            if not isinstance(root_data, dict):
+                root_data = {_TEXT_KEY: root_data} if root_data else {}
+            if records:
+                # Insert the records after the attributes and the children that precede
+                # the first record, as parse_xml_file() orders keys by first occurrence
+                items = list(root_data.items())
+                position = next((index for index, (key, _) in enumerate(items)
+                                 if key[0] != '@' and key not in preceding_tags), len(items))
+                items.insert(position, (record_tag, records))
+                root_data = dict(items)
+            
+            return {self._clean_tag_name(root.tag): root_data}
             
         except AIDXParseError:
             # Re-raise our custom errors without modification
             raise
-        except FileNotFoundError:
-            # Handle file not found specifically
+        except Exception as e:
+            # Translate XML, file-system and unexpected errors into AIDXParseError
+            raise self._file_error(e, file_path) from e
+
+    def _content_error(self, error: Exception) -> AIDXParseError:
+        """
+        Build (and log) the AIDXParseError reported for failed in-memory XML.
+        
+        Shared by parse_xml_string(), parse_xml_bytes() and parse_xml_stream() so
+        the three entry points report errors identically (files use _file_error()).
+        
+        Args:
+            error: Exception raised while parsing the XML content
+            
+        Returns:
+            AIDXParseError with a message describing the failure
+        """
+        if isinstance(error, _XMLSyntaxError):
+            # XML parsing errors (malformed XML, syntax errors, etc.)
+            error_msg = f"Failed to parse XML: {str(error)}"
+        else:
+            # Any other unexpected errors
+            error_msg = f"Unexpected error during XML parsing: {str(error)}"
+        
+        logger.error(error_msg)
+        return AIDXParseError(error_msg)
+
+    def _validate_file_path(self, file_path: Path) -> None:
+        """
+        Check that a path exists and is a regular file before parsing it.
+        
+        Args:
+            file_path: Path to validate
+            
+        Raises:
+            AIDXParseError: If the path is missing or is not a file
+        """
+        # Validate file exists
+        if not file_path.exists():
+            raise AIDXParseError(f"File not found: {file_path}")
+        
+        # Validate it's actually a file (not a directory)
+        if not file_path.is_file():
+            raise AIDXParseError(f"Path is not a file: {file_path}")
+
+    def _file_error(self, error: Exception, file_path: Path) -> AIDXParseError:
+        """
+        Build (and log) the AIDXParseError reported for a failed file parse.
+        
+        Args:
+            error: Exception raised while reading or parsing the file
+            file_path: Path of the file being parsed
+            
+        Returns:
+            AIDXParseError with a message describing the failure
+        """
+        if isinstance(error, _XMLSyntaxError):
+            # XML parsing errors (malformed XML, syntax errors, etc.)
+            error_msg = f"Failed to parse XML file {file_path}: {str(error)}"
+        elif isinstance(error, FileNotFoundError):
+            # File disappeared between validation and parsing
             error_msg = f"File not found: {file_path}"
-            logger.error(error_msg)
-            raise AIDXParseError(error_msg)
-        except PermissionError:
-            # Handle permission denied errors
+        elif isinstance(error, PermissionError):
+            # Permission denied errors
             error_msg = f"Permission denied reading file: {file_path}"
-            logger.error(error_msg)
-            raise AIDXParseError(error_msg)
-        except UnicodeDecodeError as e:
-            # Handle encoding errors (non-UTF-8 files)
-            error_msg = f"File encoding error: {str(e)}"
-            logger.error(error_msg)
-            raise AIDXParseError(error_msg) from e
-        except Exception as e:
-            # Handle any other unexpected file operation errors
-            error_msg = f"Unexpected error reading file {file_path}: {str(e)}"
-            logger.error(error_msg)
-            raise AIDXParseError(error_msg) from e
+        else:
+            # Any other unexpected file operation errors
+            error_msg = f"Unexpected error reading file {file_path}: {str(error)}"
+        
+        logger.error(error_msg)
+        return AIDXParseError(error_msg)
 
-    def to_json(self, data: Dict[str, Any], indent: int = 2) -> str:
+    def to_json(self, data: Dict[str, Any], indent: Optional[int] = 2) -> str:
         """
         Convert parsed AIDX data to formatted JSON string.
         
@@ -403,9 +988,16 @@ class AIDXParser:
         3. Ensures UTF-8 encoding for international characters
         4. Handles JSON serialization errors gracefully
         
+        When orjson is installed it is used for 2-space indented and compact
+        (indent=None) output, which is several times faster than the standard
+        library encoder; other indent widths use the json module. Both encoders
+        produce the same document: compact output has no spaces after ',' and
+        ':', and data orjson cannot encode (nesting deeper than its 255-level
+        limit) is encoded by the json module instead.
+        
         Args:
             data: Parsed AIDX data dictionary
-            indent: Number of spaces for JSON indentation (default: 2)
+            indent: Number of spaces for JSON indentation (default: 2, None = compact)
             
         Returns:
             Formatted JSON string
@@ -417,21 +1009,103 @@ class AIDXParser:
             json_output = parser.to_json(parsed_data, indent=4)
             print(json_output)  # Pretty-printed JSON
         """
-        try:
-            # Convert dictionary to JSON string with formatting
-            # ensure_ascii=False allows Unicode characters (important for international data)
-            # indent creates readable formatting
-            return json.dumps(data, indent=indent, ensure_ascii=False)
-        except (TypeError, ValueError) as e:
-            # Handle JSON serialization errors (non-serializable objects, etc.)
-            error_msg = f"Failed to convert data to JSON: {str(e)}"
-            logger.error(error_msg)
-            raise AIDXParseError(error_msg) from e
-
-
-def parse_aidx(input_source: Union[str, Path], 
+        encoded = _encode_json(data, indent)
+        # orjson produces UTF-8 bytes; the fast path decodes them once
+        return encoded.decode('utf-8') if isinstance(encoded, bytes) else encoded
+
+    def to_json_bytes(self, data: Dict[str, Any], indent: Optional[int] = 2) -> bytes:
+        """
+        Convert parsed AIDX data to UTF-8 encoded JSON bytes.
+        
+        Produces exactly the same document as to_json(), encoded as UTF-8 (both
+        use the same encoder, see _encode_json()). Use this
+        when the JSON is written to a file, socket or HTTP response: with orjson the
+        encoder's bytes are returned as is, avoiding a decode to str followed by a
+        second encode by the caller.
+        
+        Args:
+            data: Parsed AIDX data dictionary
+            indent: Number of spaces for JSON indentation (default: 2, None = compact)
+            
+        Returns:
+            UTF-8 encoded JSON bytes
+            
+        Raises:
+            AIDXParseError: If JSON serialization fails
+            
+        Example:
+            Path("flight.json").write_bytes(parser.to_json_bytes(parsed_data))
+        """
+        encoded = _encode_json(data, indent)
+        # Standard library encoder produces str; encode it once
+        return encoded if isinstance(encoded, bytes) else encoded.encode('utf-8')
+
+
+def _encode_json(data: Dict[str, Any], indent: Optional[int]) -> Union[str, bytes]:
+    """
+    Serialize parsed data to JSON with the fastest available encoder.
+    
+    This is the single encoder behind AIDXParser.to_json() and to_json_bytes(), so
+    both return the same document. orjson handles 2-space indented and compact
+    output when installed; other indent widths, environments without orjson and
+    data beyond orjson's limits (more than 255 levels of nesting) use the json
+    module, configured to produce the same text.
+    
+    Args:
+        data: Parsed AIDX data dictionary
+        indent: Number of spaces for JSON indentation (None = compact)
+        
+    Returns:
+        UTF-8 encoded bytes from orjson, or str from the json module
+        
+    Raises:
+        AIDXParseError: If JSON serialization fails
+    """
+    try:
+        if orjson is not None and indent in (2, None):
+            # orjson writes UTF-8 bytes directly and only supports 2-space indentation
+            option = orjson.OPT_INDENT_2 if indent else 0
+            try:
+                return orjson.dumps(data, option=option)
+            except orjson.JSONEncodeError:
+                # Beyond orjson's limits: the json module below produces the same
+                # document or reports the error
+                pass
+        
+        # ensure_ascii=False allows Unicode characters (important for international data);
+        # compact output drops the spaces json.dumps puts after ',' and ':' by default
+        separators = _COMPACT_SEPARATORS if indent is None else None
+        return json.dumps(data, indent=indent, ensure_ascii=False, separators=separators)
+    except (TypeError, ValueError) as e:
+        # Handle JSON serialization errors (non-serializable objects, etc.)
+        error_msg = f"Failed to convert data to JSON: {str(e)}"
+        logger.error(error_msg)
+        raise AIDXParseError(error_msg) from e
+
+
+def _is_existing_path(candidate: str) -> bool:
+    """
+    Whether a string names an existing file system entry.
+    
+    Content that is neither XML nor a path can still reach this probe, and the
+    OS rejects some strings outright (ENAMETOOLONG for long content, ValueError
+    for embedded NUL characters); those are not paths either.
+    
+    Args:
+        candidate: String that may be a file path
+        
+    Returns:
+        True if the path exists, False if it does not or cannot be a path
+    """
+    try:
+        return Path(candidate).exists()
+    except (OSError, ValueError):
+        return False
+
+
+def parse_aidx(input_source: Union[str, bytes, os.PathLike], 
                output_format: str = 'dict',
-               **parser_kwargs) -> Union[Dict[str, Any], str]:
+               **parser_kwargs) -> Union[Dict[str, Any], str, bytes]:
     """
     Convenience function to parse AIDX XML with minimal setup.
     
@@ -442,16 +1116,20 @@ def parse_aidx(input_source: Union[str, Path],
     - Output format conversion
     
     Args:
-        input_source: XML file path or XML string content
-        output_format: 'dict' for Python dictionary, 'json' for JSON string
+        input_source: XML file path (str or os.PathLike) or XML content (str or bytes).
+                      Path-like objects are always files, bytes are always XML
+                      content, and strings starting with '<' are XML content
+        output_format: 'dict' for Python dictionary, 'json' for JSON string,
+                       'json_bytes' for UTF-8 encoded JSON bytes
         **parser_kwargs: Additional arguments passed to AIDXParser constructor
                         (skip_tags, include_only_tags, preserve_namespaces, etc.)
         
     Returns:
-        Parsed data as dictionary or JSON string based on output_format
+        Parsed data as dictionary, JSON string or JSON bytes based on output_format
         
     Raises:
         AIDXParseError: If parsing fails
+        TypeError: If input_source is not a str, bytes or os.PathLike
         ValueError: If output_format is invalid
         
     Example:
@@ -469,39 +1147,80 @@ def parse_aidx(input_source: Union[str, Path],
         data = parse_aidx(xml_content)
     """
     # Validate output format parameter
-    if output_format not in ['dict', 'json']:
-        raise ValueError("output_format must be 'dict' or 'json'")
+    if output_format not in ['dict', 'json', 'json_bytes']:
+        raise ValueError("output_format must be 'dict', 'json' or 'json_bytes'")
     
     # Create parser instance with provided configuration
     parser = AIDXParser(**parser_kwargs)
     
-    # Determine if input is file path or XML string
-    # Simple heuristic: if it contains '<' it's likely XML content
-    if isinstance(input_source, (str, Path)) and not str(input_source).strip().startswith('<'):
-        # Treat as file path
-        try:
-            # Check if file exists to confirm it's a file path
-            path_obj = Path(input_source)
-            if path_obj.exists():
-                # Parse as file
-                data = parser.parse_xml_file(input_source)
-            else:
-                # File doesn't exist, treat as XML string
-                data = parser.parse_xml_string(str(input_source))
-        except Exception:
-            # If file parsing fails, try as XML string
-            data = parser.parse_xml_string(str(input_source))
+    # Determine if input is file path or XML content
+    if isinstance(input_source, os.PathLike):
+        # Path-like objects (Path, os.DirEntry, ...) always name a file
+        data = parser.parse_xml_file(Path(os.fsdecode(input_source)))
+    elif isinstance(input_source, (bytes, bytearray)):
+        # Raw bytes are always XML content
+        data = parser.parse_xml_bytes(bytes(input_source))
+    elif not isinstance(input_source, str):
+        raise TypeError(f"Unsupported input type: {type(input_source).__name__} "
+                        "(expected a file path, XML string or XML bytes)")
+    elif input_source.lstrip()[:1] == '<':
+        # Strings starting with '<' are XML content
+        data = parser.parse_xml_string(input_source)
+    elif _is_existing_path(input_source):
+        # Existing path: parse as file and let any parse error propagate
+        data = parser.parse_xml_file(input_source)
     else:
-        # Treat as XML string content
-        data = parser.parse_xml_string(str(input_source))
+        # Neither XML nor an existing file: report the XML error for the content
+        data = parser.parse_xml_string(input_source)
     
     # Return data in requested format
     if output_format == 'json':
         return parser.to_json(data)
+    elif output_format == 'json_bytes':
+        return parser.to_json_bytes(data)
     else:
         return data
 
 
+def parse_aidx_batch(paths: List[Union[str, Path]],
+                     output_format: str = 'dict',
+                     workers: Optional[int] = None,
+                     **parser_kwargs) -> List[Union[Dict[str, Any], str, bytes]]:
+    """
+    Parse many AIDX XML files in parallel worker processes.
+    
+    Each file is an independent unit of work, so files are distributed across a
+    process pool (sidestepping the GIL) and parsed with parse_aidx(). Results are
+    returned in the same order as the input paths.
+    
+    Args:
+        paths: XML file paths to parse
+        output_format: 'dict' for Python dictionary, 'json' for JSON string,
+                       'json_bytes' for UTF-8 encoded JSON bytes
+        workers: Number of worker processes (default: one per CPU)
+        **parser_kwargs: Additional arguments passed to AIDXParser constructor
+        
+    Returns:
+        List of parsed results, one per input path
+        
+    Raises:
+        AIDXParseError: If parsing any file fails
+        ValueError: If output_format is invalid
+        
+    Example:
+        files = sorted(Path("AOS xml files").glob("*.xml"))
+        results = parse_aidx_batch(files, skip_tags=['TPA_Extension'])
+    """
+    # Validate output format up front rather than in every worker
+    if output_format not in ['dict', 'json', 'json_bytes']:
+        raise ValueError("output_format must be 'dict', 'json' or 'json_bytes'")
+    
+    # Bind the options once; files are sent to workers in chunks to amortize IPC
+    parse_one = partial(parse_aidx, output_format=output_format, **parser_kwargs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_one, [Path(path) for path in paths], chunksize=8))
+
+
 def main():
     """
     Demonstration function showing AIDX parser capabilities.
@@ -599,6 +1318,16 @@ def main():
     except Exception as e:
         print(f"   ❌ Error: {e}")
     
+    # Example 4: Parse a whole directory in parallel
+    print("4. Parsing all sample files in parallel:")
+    try:
+        all_files = sorted(Path("AOS xml files").glob("*.xml"))
+        if all_files:
+            batch_results = parse_aidx_batch(all_files)
+            print(f"   ✅ Parsed {len(batch_results)} files across worker processes")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+    
     print(f"\n🎉 Demo completed!")
     print(f"\n📚 Usage Examples:")
     print("   # Basic usage")
@@ -26,16 +26,27 @@ Python: 3.9+
 
 # Import required modules
 import os
-import json
+import io
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
-import traceback
-from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple, BinaryIO
+from itertools import chain
+import hashlib
+import threading
+from queue import Queue
+from contextlib import contextmanager
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+import time
+from datetime import datetime, timezone
 
 # Flask and related imports
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, request, jsonify, render_template, send_from_directory, Response
 from flask_cors import CORS
+from flask_caching import Cache
+from flask_compress import Compress
 from werkzeug.utils import secure_filename
 from werkzeug.exceptions import RequestEntityTooLarge
 
@@ -61,13 +72,38 @@ class Config:
     
     # File upload settings
     MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))  # 16MB default
-    UPLOAD_FOLDER = 'uploads'
-    ALLOWED_EXTENSIONS = {'xml'}
+    UPLOAD_FOLDER = 'uploads'  # Reserved; uploads are converted from the request stream, never saved
+    ALLOWED_EXTENSIONS = frozenset({'xml'})
+    UPLOAD_CHUNK_SIZE = 64 * 1024  # Bytes read from an upload per parser feed
     
     # AIDX Parser settings
     PARSER_SKIP_TAGS = ['TPA_Extension']  # Skip complex vendor extensions by default
     PARSER_INCLUDE_ATTRIBUTES = True
     PARSER_PRESERVE_NAMESPACES = False
+    PARSER_POOL_SIZE = int(os.environ.get('PARSER_POOL_SIZE', os.cpu_count() or 4))
+    
+    # Uploads at least this large are converted in a worker process so a long
+    # CPU-bound parse does not hold the GIL for every other request thread
+    PARSER_OFFLOAD_SIZE = int(os.environ.get('PARSER_OFFLOAD_SIZE', 1024 * 1024))  # 1MB default
+    PARSER_PROCESS_WORKERS = int(os.environ.get('PARSER_PROCESS_WORKERS', 2))
+    
+    # Response cache settings (in-process cache for read-only endpoints)
+    CACHE_TYPE = 'SimpleCache'
+    CACHE_DEFAULT_TIMEOUT = 30
+    HEALTH_CACHE_TIMEOUT = 10  # Seconds a health check result is reused
+    CONVERT_CACHE_TIMEOUT = 600  # Seconds converted JSON is reused for an identical upload
+    CONVERT_CACHE_MAX_SIZE = 2 * 1024 * 1024  # Larger JSON output is not cached
+    # Memory the cache may hold per worker process (every gunicorn worker has its
+    # own SimpleCache). Entry count is capped so that even entries of the maximum
+    # size fit the budget; SimpleCache prunes before inserting, so it can briefly
+    # hold one entry over its threshold
+    CONVERT_CACHE_MEMORY = int(os.environ.get('CONVERT_CACHE_MEMORY', 64 * 1024 * 1024))  # 64MB default
+    CACHE_THRESHOLD = max(1, CONVERT_CACHE_MEMORY // CONVERT_CACHE_MAX_SIZE - 1)
+    INDEX_CACHE_MAX_AGE = 3600  # Seconds browsers may reuse the main page
+    
+    # Response compression (JSON output is highly repetitive and compresses well)
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_MIN_SIZE = 1024  # Bytes; smaller responses are sent uncompressed
     
     # Environment settings
     DEBUG = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
@@ -89,16 +125,121 @@ app.config.from_object(Config)
 # Enable CORS for development
 CORS(app, origins=Config.CORS_ORIGINS)
 
+# Compress responses for clients that accept br/gzip
+Compress(app)
+
+# Enable response caching for read-only endpoints
+cache = Cache(app)
+
 # Create upload directory if it doesn't exist
 upload_dir = Path(app.config['UPLOAD_FOLDER'])
 upload_dir.mkdir(exist_ok=True)
 
-# Initialize AIDX parser with default configuration
-default_parser = AIDXParser(
-    skip_tags=Config.PARSER_SKIP_TAGS,
-    include_attributes=Config.PARSER_INCLUDE_ATTRIBUTES,
-    preserve_namespaces=Config.PARSER_PRESERVE_NAMESPACES
-)
+# AIDX parser configuration shared by request threads and worker processes
+PARSER_OPTIONS = {
+    'skip_tags': Config.PARSER_SKIP_TAGS,
+    'include_attributes': Config.PARSER_INCLUDE_ATTRIBUTES,
+    'preserve_namespaces': Config.PARSER_PRESERVE_NAMESPACES
+}
+
+# Pool of AIDX parsers, one per concurrently converting request thread. A parser
+# reuses its lxml parser object between calls, and those must not be shared by
+# threads, so each request borrows a parser for the duration of its conversion.
+_parser_pool: "Queue[AIDXParser]" = Queue()
+for _ in range(Config.PARSER_POOL_SIZE):
+    _parser_pool.put(AIDXParser(**PARSER_OPTIONS))
+
+@contextmanager
+def pooled_parser() -> Iterator[AIDXParser]:
+    """
+    Borrow an AIDX parser from the pool, waiting if all parsers are in use.
+    
+    Yields:
+        AIDXParser: Parser configured with PARSER_OPTIONS, returned to the pool on exit
+    """
+    parser = _parser_pool.get()
+    try:
+        yield parser
+    finally:
+        _parser_pool.put(parser)
+
+# Process pool for large conversions, started on first use
+_parse_executor = None
+_parse_executor_lock = threading.Lock()
+
+def get_parse_executor() -> ProcessPoolExecutor:
+    """
+    Get the process pool used to convert large uploads, creating it on first use.
+    
+    Workers are spawned rather than forked, since forking a multi-threaded
+    server process is unsafe. A spawned worker re-imports the main module:
+    under gunicorn that is only gunicorn's entry script (plus the parser
+    module for the conversions), but when the server is started with
+    `python app.py`, every worker re-imports app.py as __mp_main__ and so
+    also builds the Flask app, cache, compression setup and parser pool.
+    
+    Returns:
+        ProcessPoolExecutor: Shared pool of parser worker processes
+    """
+    global _parse_executor
+    with _parse_executor_lock:
+        if _parse_executor is None:
+            _parse_executor = ProcessPoolExecutor(
+                max_workers=Config.PARSER_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _parse_executor
+
+def reset_parse_executor(broken_executor: ProcessPoolExecutor) -> None:
+    """
+    Discard a broken process pool so the next conversion starts a new one.
+    
+    A pool whose worker died (killed, out of memory, failed to spawn) rejects
+    every later task with BrokenProcessPool. The shared pool is only cleared
+    if it is still the broken one, so concurrent requests that hit the same
+    failure do not discard a pool another request has just created.
+    
+    Args:
+        broken_executor: Pool that raised BrokenProcessPool
+    """
+    global _parse_executor
+    with _parse_executor_lock:
+        if _parse_executor is broken_executor:
+            _parse_executor = None
+    broken_executor.shutdown(wait=False, cancel_futures=True)
+
+# Worker-side conversion: XML bytes in, JSON bytes out (no dict crosses processes)
+convert_in_worker = partial(parse_aidx, output_format='json_bytes', **PARSER_OPTIONS)
+
+def convert_in_process_pool(xml_bytes: bytes) -> bytes:
+    """
+    Convert XML bytes to JSON bytes in a worker process.
+    
+    If the pool is broken, it is replaced and the conversion is retried once
+    on the new pool.
+    
+    Args:
+        xml_bytes: Complete XML document
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+        
+    Raises:
+        AIDXParseError: If the XML cannot be parsed
+        BrokenProcessPool: If the new pool breaks as well
+    """
+    for attempt in range(2):
+        executor = get_parse_executor()
+        try:
+            return executor.submit(convert_in_worker, xml_bytes).result()
+        except BrokenProcessPool:
+            logger.warning("Parser process pool is broken; starting a new one")
+            reset_parse_executor(executor)
+            if attempt:
+                raise
+
+# Allowed file suffixes (e.g. '.xml'), built once for a single endswith() check
+_ALLOWED_SUFFIXES = tuple('.' + extension.lower() for extension in Config.ALLOWED_EXTENSIONS)
 
 def allowed_file(filename: str) -> bool:
     """
@@ -110,38 +251,88 @@ def allowed_file(filename: str) -> bool:
     Returns:
         bool: True if file extension is allowed, False otherwise
     """
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+# Number of leading content bytes returned for sniffing an upload
+_HEAD_SIZE = 256
 
-def validate_xml_file(file_content: str, filename: str) -> Tuple[bool, str]:
+def read_upload(stream: BinaryIO) -> Tuple[bytes, Iterator[bytes]]:
     """
-    Validate XML file content and structure.
+    Read an uploaded file in bounded chunks, peeking at its first content.
+    
+    Chunks are read lazily as the parser consumes them, so an upload is never
+    held in memory as one string. Leading whitespace-only chunks are read up
+    front to find where the content starts.
     
     Args:
-        file_content: Content of the XML file as string
-        filename: Name of the file for error reporting
+        stream: Binary stream of the uploaded file
         
     Returns:
-        Tuple[bool, str]: (is_valid, error_message)
+        Tuple[bytes, Iterator[bytes]]: (first bytes of content with leading
+        whitespace removed, iterator over every chunk of the file in order)
     """
-    try:
-        # Check if file is empty
-        if not file_content.strip():
-            return False, "File is empty"
-        
-        # Check if content looks like XML
-        if not file_content.strip().startswith('<?xml') and not file_content.strip().startswith('<'):
-            return False, "File does not appear to be valid XML"
-        
-        # Try to parse with our AIDX parser (this will validate XML structure)
-        default_parser.parse_xml_string(file_content)
+    chunk_size = app.config['UPLOAD_CHUNK_SIZE']
+    chunks = iter(lambda: stream.read(chunk_size), b'')
+    
+    # Collect chunks until the first one with non-whitespace content. Only a short
+    # prefix is inspected, so the whole chunk is copied only in the rare case of
+    # a long whitespace run at the start
+    leading = []
+    head = b''
+    for chunk in chunks:
+        leading.append(chunk)
+        head = chunk[:_HEAD_SIZE].lstrip() or chunk.lstrip()[:_HEAD_SIZE]
+        if head:
+            break
+    
+    return head, chain(leading, chunks)
+
+def upload_digest(stream: BinaryIO) -> str:
+    """
+    Hash the content of a seekable upload for the conversion cache.
+    
+    The stream is read in bounded chunks and rewound afterwards, so it can
+    still be converted when the digest is not found in the cache.
+    
+    Args:
+        stream: Seekable binary stream of the uploaded file
         
-        return True, ""
+    Returns:
+        str: Hex BLAKE2b digest (128-bit) of the upload bytes
+    """
+    chunk_size = app.config['UPLOAD_CHUNK_SIZE']
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: stream.read(chunk_size), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+def validate_xml_file(file_head: bytes, filename: str) -> Tuple[bool, str]:
+    """
+    Check that an uploaded file looks like XML before parsing it.
+    
+    Only the start of the content is inspected; well-formedness is checked by
+    the parser itself while it converts the file.
+    
+    Args:
+        file_head: Start of the file content with leading whitespace removed
+        filename: Name of the file for error reporting
         
-    except AIDXParseError as e:
-        return False, f"AIDX parsing error: {str(e)}"
-    except Exception as e:
-        return False, f"XML validation error: {str(e)}"
+    Returns:
+        Tuple[bool, str]: (is_valid, error_message)
+    """
+    # Check if file is empty
+    if not file_head:
+        return False, "File is empty"
+    
+    # Check if content looks like XML (declaration or root element)
+    if not file_head.startswith(b'<'):
+        return False, "File does not appear to be valid XML"
+    
+    return True, ""
+
+# Size units, one per power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
 
 def format_file_size(size_bytes: int) -> str:
     """
@@ -156,30 +347,156 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    # Each unit is 2**10 times the previous one, so the bit length picks the unit
+    i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
+
+# The upload limit is fixed at startup, so format it once for error messages
+_MAX_SIZE_STR = format_file_size(Config.MAX_CONTENT_LENGTH)
+
+# Constant error responses, serialized once (exactly as jsonify would) so that
+# scanners and bad requests cost no per-request JSON encoding
+_ERROR_BODIES = {
+    status: app.json.response(body).get_data()
+    for status, body in {
+        404: {
+            'error': 'Not found',
+            'details': 'The requested resource was not found'
+        },
+        405: {
+            'error': 'Method not allowed',
+            'details': 'The requested method is not allowed for this endpoint'
+        },
+        413: {
+            'error': 'File too large',
+            'details': f'Maximum file size is {_MAX_SIZE_STR}'
+        },
+        500: {
+            'error': 'Internal server error',
+            'details': 'An unexpected server error occurred'
+        }
+    }.items()
+}
+
+def error_response(status: int) -> Response:
+    """
+    Build one of the constant JSON error responses.
+    
+    Args:
+        status: HTTP status code with a body in _ERROR_BODIES
+        
+    Returns:
+        Response: Preserialized JSON error response
+    """
+    return Response(_ERROR_BODIES[status], status=status, mimetype='application/json')
+
+def json_response_with_data(envelope: Dict[str, Any], json_data: bytes) -> Response:
+    """
+    Build a JSON response that embeds already-serialized data as 'json_data'.
+    
+    The converted document is usually the bulk of a /convert response. It is
+    serialized exactly once (by the parser) and spliced into the small envelope
+    instead of being encoded a second time by jsonify.
     
-    return f"{size_bytes:.1f} {size_names[i]}"
+    Args:
+        envelope: Non-empty response fields other than the converted data
+        json_data: Serialized JSON of the converted data
+        
+    Returns:
+        Response: application/json response with json_data added to the envelope
+    """
+    # Serialize the envelope and reopen its closing brace to append json_data
+    envelope_json = app.json.dumps(envelope).encode('utf-8')
+    body = b''.join((envelope_json[:-1], b',"json_data":', json_data, b'}'))
+    return Response(body, mimetype='application/json')
+
+# Rendered main page and its ETag, filled in by the first request
+_index_page: Optional[Tuple[bytes, str]] = None
 
 @app.route('/')
 def index():
     """
     Serve the main application page.
     
+    The page has no per-request template variables, so it is rendered once and
+    the same bytes are served afterwards with an ETag and Cache-Control header;
+    browsers revalidate with If-None-Match and get a 304 without a body
+    (also when they hold the compressed variant's ETag).
+    In debug mode the template is rendered on every request so edits show up.
+    
     Returns:
-        Rendered HTML template for the main application
+        Rendered HTML for the main application (or 304 Not Modified)
     """
+    global _index_page
     logger.info("Serving main application page")
-    return render_template('index.html')
+    
+    # Render the template once (it needs a request context for url_for)
+    if _index_page is None or app.debug:
+        body = render_template('index.html').encode('utf-8')
+        _index_page = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+    body, etag = _index_page
+    
+    # Compression appends ':<algorithm>' to the ETag, so compare the base value and
+    # echo back the exact tag the client holds
+    for client_etag in request.if_none_match.as_set():
+        if client_etag.split(':', 1)[0] == etag:
+            response = Response(status=304)
+            response.set_etag(client_etag)
+            break
+    else:
+        response = Response(body, mimetype='text/html')
+        response.set_etag(etag)
+    
+    response.cache_control.public = True
+    response.cache_control.max_age = app.config['INDEX_CACHE_MAX_AGE']
+    return response
+
+# Upload limit as a plain int for the per-request pre-check
+_MAX_CONTENT_LENGTH = Config.MAX_CONTENT_LENGTH
+
+# Content types accepted as a raw XML request body (bypasses multipart form parsing)
+RAW_XML_MIMETYPES = frozenset({'application/xml', 'text/xml'})
+
+@app.before_request
+def reject_unacceptable_uploads():
+    """
+    Reject oversized or unsupported uploads to /convert before the body is read.
+    
+    The declared Content-Length and Content-Type are checked from the headers, so
+    junk requests never reach Werkzeug's multipart parser. (File names travel
+    inside the multipart body, so they are still checked by the route.)
+    
+    Returns:
+        JSON error response (413/415) to stop the request, or None to continue
+    """
+    if request.endpoint != 'convert_xml_to_json':
+        return None
+    
+    # Declared body size over the limit: refuse without consuming the socket
+    content_length = request.content_length
+    if content_length is not None and content_length > _MAX_CONTENT_LENGTH:
+        logger.warning("Rejected upload of %d bytes (limit %s)", content_length, _MAX_SIZE_STR)
+        return error_response(413)
+    
+    # Files must be uploaded as a multipart form or sent as a raw XML body
+    if request.mimetype != 'multipart/form-data' and request.mimetype not in RAW_XML_MIMETYPES:
+        logger.warning("Rejected upload with content type: %s", request.mimetype or 'none')
+        return jsonify({
+            'error': 'Unsupported media type',
+            'details': 'Upload the XML file as multipart/form-data or send it as application/xml'
+        }), 415
+    
+    return None
 
 @app.route('/convert', methods=['POST'])
 def convert_xml_to_json():
     """
     Convert uploaded XML file to JSON format.
     
+    The XML can be sent as the "file" field of a multipart form (browser uploads)
+    or as a raw application/xml / text/xml request body (API clients), which
+    skips multipart parsing entirely; ?filename= names a raw upload.
+    
     This endpoint handles:
     - File upload validation
     - XML parsing and conversion
@@ -189,214 +506,265 @@ def convert_xml_to_json():
     Returns:
         JSON response with conversion results or error information
     """
-    start_time = datetime.now()
+    # Monotonic clock for elapsed time (unaffected by wall-clock adjustments)
+    start_time = time.perf_counter()
     
     try:
-        # Check if file was uploaded
-        if 'file' not in request.files:
-            logger.warning("No file uploaded in request")
-            return jsonify({
-                'error': 'No file uploaded',
-                'details': 'Please select an XML file to convert'
-            }), 400
-        
-        file = request.files['file']
-        
-        # Check if file was selected
-        if file.filename == '':
-            logger.warning("No file selected")
-            return jsonify({
-                'error': 'No file selected',
-                'details': 'Please select a valid XML file'
-            }), 400
-        
-        # Validate file extension
-        if not allowed_file(file.filename):
-            logger.warning(f"Invalid file type: {file.filename}")
-            return jsonify({
-                'error': 'Invalid file type',
-                'details': 'Only XML files are supported'
-            }), 400
-        
-        # Read file content
-        try:
-            file_content = file.read().decode('utf-8')
-            file_size = len(file_content.encode('utf-8'))
+        if request.mimetype in RAW_XML_MIMETYPES:
+            # Raw XML body, no multipart parsing. It is buffered (bounded by
+            # MAX_CONTENT_LENGTH) so it can be hashed before it is converted
+            filename = secure_filename(request.args.get('filename', '')) or 'upload.xml'
+            upload = io.BytesIO(request.get_data(cache=False))
+        else:
+            # Check if file was uploaded
+            if 'file' not in request.files:
+                logger.warning("No file uploaded in request")
+                return jsonify({
+                    'error': 'No file uploaded',
+                    'details': 'Please select an XML file to convert'
+                }), 400
             
-            logger.info(f"Processing file: {file.filename} ({format_file_size(file_size)})")
+            file = request.files['file']
+            filename = file.filename
             
-        except UnicodeDecodeError:
-            logger.error(f"Failed to decode file: {file.filename}")
-            return jsonify({
-                'error': 'File encoding error',
-                'details': 'File must be UTF-8 encoded XML'
-            }), 400
+            # Check if file was selected
+            if filename == '':
+                logger.warning("No file selected")
+                return jsonify({
+                    'error': 'No file selected',
+                    'details': 'Please select a valid XML file'
+                }), 400
+            
+            # Validate file extension
+            if not allowed_file(filename):
+                logger.warning("Invalid file type: %s", filename)
+                return jsonify({
+                    'error': 'Invalid file type',
+                    'details': 'Only XML files are supported'
+                }), 400
+            
+            # Werkzeug has already spooled the upload
+            upload = file.stream
+        
+        # Measure the upload without reading it
+        file_size = upload.seek(0, os.SEEK_END)
+        upload.seek(0)
         
-        # Validate XML content
-        is_valid, validation_error = validate_xml_file(file_content, file.filename)
+        # Only format the size when the message will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Processing file: %s (%s)", filename, format_file_size(file_size))
+        
+        # Validate XML content from the first bytes of the upload, before any
+        # work proportional to its size (such as hashing) is done
+        file_head, _ = read_upload(upload)
+        is_valid, validation_error = validate_xml_file(file_head, filename)
         if not is_valid:
-            logger.error(f"XML validation failed for {file.filename}: {validation_error}")
+            logger.error("XML validation failed for %s: %s", filename, validation_error)
             return jsonify({
                 'error': 'XML validation failed',
                 'details': validation_error
             }), 400
+        upload.seek(0)
         
-        # Parse XML to JSON using AIDX parser
-        try:
-            # Parse the XML content
-            parsed_data = default_parser.parse_xml_string(file_content)
+        # Identical uploads (re-uploaded samples, replayed monitor files) reuse the
+        # JSON converted the first time, skipping both parse and serialize
+        cache_key = 'convert:' + upload_digest(upload)
+        json_bytes = cache.get(cache_key)
+        cache_hit = json_bytes is not None
+        
+        if not cache_hit:
+            # The digest rewound the upload; read it again for the parser
+            _, file_chunks = read_upload(upload)
             
-            # Convert to JSON string for size calculation
-            json_string = json.dumps(parsed_data, indent=2)
-            json_size = len(json_string.encode('utf-8'))
+            # Parse the XML content while it is read from the upload. This single parse
+            # also validates the XML, so malformed documents are reported from here
+            try:
+                if file_size >= app.config['PARSER_OFFLOAD_SIZE']:
+                    # Large upload: parse and serialize in a worker process. The worker
+                    # needs the whole document; the upload is re-read in one piece
+                    # rather than joining chunks (which would copy every byte twice)
+                    upload.seek(0)
+                    json_bytes = convert_in_process_pool(upload.read())
+                else:
+                    with pooled_parser() as parser:
+                        parsed_data = parser.parse_xml_stream(file_chunks)
+            except AIDXParseError as e:
+                logger.error("XML validation failed for %s: %s", filename, e)
+                return jsonify({
+                    'error': 'XML validation failed',
+                    'details': f"AIDX parsing error: {str(e)}"
+                }), 400
+            except BrokenProcessPool:
+                # Both the pool and its replacement failed: report a temporary outage
+                logger.error("Parser worker processes unavailable for %s", filename)
+                return jsonify({
+                    'error': 'Conversion temporarily unavailable',
+                    'details': 'Parser worker processes could not be started; please retry',
+                    'filename': filename
+                }), 503
+        else:
+            logger.info("Conversion cache hit for %s", filename)
+        
+        # Convert the parsed data to JSON
+        try:
+            # Serialize the parsed data once; the same bytes are sent in the response
+            if json_bytes is None:
+                with pooled_parser() as parser:
+                    json_bytes = parser.to_json_bytes(parsed_data)
+            if not cache_hit and len(json_bytes) <= app.config['CONVERT_CACHE_MAX_SIZE']:
+                cache.set(cache_key, json_bytes, timeout=app.config['CONVERT_CACHE_TIMEOUT'])
+            json_size = len(json_bytes)
             
             # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time = (time.perf_counter() - start_time) * 1000
             
-            logger.info(f"Successfully converted {file.filename} in {processing_time:.2f}ms")
+            logger.info("Successfully converted %s in %.2fms", filename, processing_time)
             
-            # Return successful conversion result
-            return jsonify({
+            # Build the result envelope
+            result = {
                 'success': True,
-                'filename': file.filename,
+                'filename': filename,
                 'original_size': file_size,
                 'json_size': json_size,
-                'processing_time_ms': round(processing_time, 2),
-                'json_data': parsed_data,
-                'metadata': {
+                'processing_time_ms': round(processing_time, 2)
+            }
+            
+            # Metadata is informational; clients can opt out with ?metadata=0
+            if request.args.get('metadata', '1').lower() not in ('0', 'false'):
+                result['metadata'] = {
                     'parser_version': '1.0',
-                    'conversion_timestamp': datetime.now().isoformat(),
+                    'conversion_timestamp': datetime.now(timezone.utc).isoformat(),
                     'file_info': {
-                        'name': file.filename,
+                        'name': filename,
                         'size_bytes': file_size,
                         'size_formatted': format_file_size(file_size)
                     },
                     'json_info': {
                         'size_bytes': json_size,
                         'size_formatted': format_file_size(json_size),
-                        'line_count': len(json_string.split('\n'))
+                        # Counted in C over the bytes; no list of lines is built
+                        'line_count': json_bytes.count(b'\n') + 1
                     }
                 }
-            })
+            
+            # Return successful conversion result
+            return json_response_with_data(result, json_bytes)
             
         except AIDXParseError as e:
-            logger.error(f"AIDX parsing error for {file.filename}: {str(e)}")
+            logger.error("AIDX parsing error for %s: %s", filename, e)
             return jsonify({
                 'error': 'AIDX parsing failed',
                 'details': str(e),
-                'filename': file.filename
+                'filename': filename
             }), 422
             
         except Exception as e:
-            logger.error(f"Unexpected parsing error for {file.filename}: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Unexpected parsing error for %s: %s", filename, e)
             return jsonify({
                 'error': 'Conversion failed',
                 'details': f'An unexpected error occurred: {str(e)}',
-                'filename': file.filename
+                'filename': filename
             }), 500
     
     except RequestEntityTooLarge:
         logger.error("File too large")
-        return jsonify({
-            'error': 'File too large',
-            'details': f'Maximum file size is {format_file_size(app.config["MAX_CONTENT_LENGTH"])}'
-        }), 413
+        return error_response(413)
     
     except Exception as e:
-        logger.error(f"Unexpected server error: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Unexpected server error: %s", e)
         return jsonify({
             'error': 'Server error',
             'details': 'An unexpected server error occurred'
         }), 500
 
 @app.route('/health', methods=['GET'])
+# Only healthy results are reused: the unhealthy view returns a (response, 500)
+# tuple, which has no status_code, so a failed probe is re-run on the next request
+@cache.cached(timeout=Config.HEALTH_CACHE_TIMEOUT,
+              response_filter=lambda rv: getattr(rv, 'status_code', None) == 200)
 def health_check():
     """
     Health check endpoint for monitoring.
     
+    Liveness probes call this many times per minute, so the result of the parser
+    self-test is cached for a few seconds instead of re-running it per probe.
+    Failures are never cached, so the endpoint reports recovery right away.
+    
     Returns:
         JSON response with application health status
     """
     try:
         # Test parser functionality
         test_xml = '<?xml version="1.0"?><test>Hello</test>'
-        default_parser.parse_xml_string(test_xml)
+        with pooled_parser() as parser:
+            parser.parse_xml_string(test_xml)
         
         return jsonify({
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
             'version': '1.0',
             'parser_status': 'operational'
         })
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        logger.error("Health check failed: %s", e)
         return jsonify({
             'status': 'unhealthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
             'error': str(e)
         }), 500
 
+# API information never changes while the app runs, so serialize it once
+# (exactly the body jsonify would produce)
+_API_INFO_JSON = app.json.response({
+    'name': 'AIDX XML to JSON Converter API',
+    'version': '1.0',
+    'description': 'Convert AIDX XML files to JSON format',
+    'endpoints': {
+        '/': 'Main application page',
+        '/convert': 'Convert XML file to JSON (POST a multipart "file" field, or the raw XML '
+                    'as an application/xml body with optional ?filename=; ?metadata=0 omits metadata)',
+        '/health': 'Health check endpoint',
+        '/api/info': 'API information'
+    },
+    'supported_formats': ['xml'],
+    'max_file_size': _MAX_SIZE_STR,
+    'parser_config': {
+        'skip_tags': Config.PARSER_SKIP_TAGS,
+        'include_attributes': Config.PARSER_INCLUDE_ATTRIBUTES,
+        'preserve_namespaces': Config.PARSER_PRESERVE_NAMESPACES
+    }
+}).get_data()
+
 @app.route('/api/info', methods=['GET'])
 def api_info():
     """
     Get API information and capabilities.
     
     Returns:
-        JSON response with API information
-    """
-    return jsonify({
-        'name': 'AIDX XML to JSON Converter API',
-        'version': '1.0',
-        'description': 'Convert AIDX XML files to JSON format',
-        'endpoints': {
-            '/': 'Main application page',
-            '/convert': 'Convert XML file to JSON (POST)',
-            '/health': 'Health check endpoint',
-            '/api/info': 'API information'
-        },
-        'supported_formats': ['xml'],
-        'max_file_size': format_file_size(app.config['MAX_CONTENT_LENGTH']),
-        'parser_config': {
-            'skip_tags': Config.PARSER_SKIP_TAGS,
-            'include_attributes': Config.PARSER_INCLUDE_ATTRIBUTES,
-            'preserve_namespaces': Config.PARSER_PRESERVE_NAMESPACES
-        }
-    })
+        JSON response with API information (serialized once at startup)
+    """
+    return Response(_API_INFO_JSON, mimetype='application/json')
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
-        'error': 'Not found',
-        'details': 'The requested resource was not found'
-    }), 404
+    return error_response(404)
 
 @app.errorhandler(405)
 def method_not_allowed(error):
     """Handle 405 errors"""
-    return jsonify({
-        'error': 'Method not allowed',
-        'details': 'The requested method is not allowed for this endpoint'
-    }), 405
+    return error_response(405)
 
 @app.errorhandler(413)
 def request_entity_too_large(error):
     """Handle file too large errors"""
-    return jsonify({
-        'error': 'File too large',
-        'details': f'Maximum file size is {format_file_size(app.config["MAX_CONTENT_LENGTH"])}'
-    }), 413
+    return error_response(413)
 
 @app.errorhandler(500)
 def internal_server_error(error):
     """Handle 500 errors"""
-    logger.error(f"Internal server error: {str(error)}")
-    return jsonify({
-        'error': 'Internal server error',
-        'details': 'An unexpected server error occurred'
-    }), 500
+    logger.error("Internal server error: %s", error)
+    return error_response(500)
 
 if __name__ == '__main__':
     """
@@ -408,9 +776,9 @@ if __name__ == '__main__':
     
     # Log startup information
     logger.info("Starting AIDX XML to JSON Converter Web Application")
-    logger.info(f"Debug mode: {app.config['DEBUG']}")
-    logger.info(f"Max file size: {format_file_size(app.config['MAX_CONTENT_LENGTH'])}")
-    logger.info(f"Upload directory: {upload_dir.absolute()}")
+    logger.info("Debug mode: %s", app.config['DEBUG'])
+    logger.info("Max file size: %s", _MAX_SIZE_STR)
+    logger.info("Upload directory: %s", upload_dir.absolute())
     
     # Server configuration based on environment
     if app.config['DEBUG']:
@@ -424,7 +792,7 @@ if __name__ == '__main__':
     else:
         # Production configuration
         logger.info("Running in production mode")
-        logger.info(f"Server will bind to {Config.HOST}:{Config.PORT}")
+        logger.info("Server will bind to %s:%s", Config.HOST, Config.PORT)
         app.run(
             host=Config.HOST,
             port=Config.PORT,
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Gunicorn configuration for the AIDX XML to JSON Converter.
+
+Gunicorn loads this file automatically from the working directory, so the
+Procfile and platform start commands can stay as plain `gunicorn app:app`.
+
+Uploads spend most of their time waiting on the network, so each worker
+process runs a pool of threads: a slow upload occupies one thread instead of
+a whole worker, while separate processes keep CPU-bound parsing off a
+single GIL.
+
+Settings can be tuned per deployment with environment variables:
+- WEB_CONCURRENCY: Number of worker processes (default: 2, set by Heroku)
+- GUNICORN_THREADS: Threads per worker process (default: 8)
+- GUNICORN_TIMEOUT: Seconds before a silent worker is restarted (default: 60)
+"""
+
+import os
+
+# Threaded workers: concurrent uploads share a process without blocking it
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Large uploads can take a while to arrive and parse
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+keepalive = 5
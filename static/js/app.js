@@ -335,7 +335,8 @@ class AIDXConverter {
         const formData = new FormData();
         formData.append('file', file);
         
-        const response = await fetch('/convert', {
+        // The UI only displays json_data, so skip the informational metadata
+        const response = await fetch('/convert?metadata=0', {
             method: 'POST',
             body: formData
         });
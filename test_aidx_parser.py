@@ -14,6 +14,10 @@ checking for accuracy, correct conversion, and data integrity. The test suite pe
 7. Parser configuration options - Tests various parser settings
 8. Convenience function testing - Validates helper functions
 9. Error handling - Tests parser behavior with invalid inputs
+10. Streaming parse - Compares incremental parsing with the tree parser
+11. Batch parsing - Validates parallel parsing of many files
+12. XML backends - Compares output across the available parsing backends
+13. Chunked input - Validates parsing XML fed in chunks (e.g. uploads)
 
 The test suite processes all XML files in the 'AOS xml files' directory and provides
 detailed reporting on success rates, failures, and extracted data.
@@ -26,14 +30,501 @@ Python: 3.9+
 # Import required standard library modules
 import unittest                                    # For test framework
 import json                                       # For JSON validation
-import xml.etree.ElementTree as ET               # For XML validation
+import re                                         # For filename classification
+try:
+    from lxml import etree as ET                  # For XML validation (C parser)
+    XMLElement = ET._Element                      # Element type for type hints
+except ImportError:
+    import xml.etree.ElementTree as ET           # For XML validation (fallback)
+    XMLElement = ET.Element
 from pathlib import Path                          # For file path handling
-from typing import Dict, Any, List, Tuple        # For type hints
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple, Union  # For type hints
 import time                                       # For performance measurement
 import sys                                        # For system operations
+import os                                         # For CPU affinity and stat calls
+import mmap                                       # For mapping large XML files
+import pickle                                     # For the optional on-disk cache
+from contextlib import contextmanager             # For scoped file access
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # For parallel file loading
+import threading                                  # For per-thread parsers (free-threaded builds)
+from functools import lru_cache, wraps            # For shared parsers and test wrappers
+import tempfile                                   # For temporary test files
+from unittest import mock                         # For patching out optional encoders
+from types import SimpleNamespace                 # For cached per-file results
+
+# Use orjson (C-implemented JSON encoder) for canonical fingerprints when installed
+try:
+    import orjson                                 # For fast JSON fingerprints (optional)
+except ImportError:
+    orjson = None
 
 # Import our AIDX parser modules
-from aidx_parser import AIDXParser, parse_aidx, AIDXParseError
+import aidx_parser
+from aidx_parser import AIDXParser, parse_aidx, parse_aidx_batch, AIDXParseError
+# The parser's own tag-name helper, so element lookups use the same dict keys
+from aidx_parser import _local_name
+
+# Flight type named in a test file's name (first match wins, case-insensitive)
+_FLIGHT_TYPE_RE = re.compile(r'(arrival|departure)', re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _build_parser(skip_tags: Tuple[str, ...],
+                  include_only_tags: Tuple[str, ...],
+                  preserve_namespaces: bool,
+                  include_attributes: bool,
+                  backend: str) -> AIDXParser:
+    """Build the AIDXParser for one frozen configuration (memoized)."""
+    return AIDXParser(skip_tags=list(skip_tags) if skip_tags is not None else None,
+                      include_only_tags=list(include_only_tags) if include_only_tags is not None else None,
+                      preserve_namespaces=preserve_namespaces,
+                      include_attributes=include_attributes,
+                      backend=backend)
+
+
+def _get_parser(skip_tags: List[str] = None,
+                include_only_tags: List[str] = None,
+                preserve_namespaces: bool = False,
+                include_attributes: bool = True,
+                backend: str = None) -> AIDXParser:
+    """
+    Return a shared AIDXParser for the given configuration.
+    
+    Tests that use the same options share one parser instance (and its tag
+    caches) instead of constructing a new one each time. Tag lists are frozen
+    into sorted tuples so the configuration can be used as a cache key.
+    
+    Args:
+        skip_tags: Tag names to skip during parsing
+        include_only_tags: Only parse these tags
+        preserve_namespaces: Keep namespace prefixes
+        include_attributes: Include XML attributes
+        backend: XML backend name (None for the default)
+        
+    Returns:
+        AIDXParser configured with these options
+    """
+    return _build_parser(tuple(sorted(skip_tags)) if skip_tags is not None else None,
+                         tuple(sorted(include_only_tags)) if include_only_tags is not None else None,
+                         preserve_namespaces, include_attributes, backend)
+
+
+# AIDX schema keys used by the flight extractors. The parser interns its output
+# keys, so for results parsed in this process interning these too lets dict
+# lookups match by identity ('@' names are not identifiers, so Python would not
+# intern those literals itself). Results unpickled from worker processes or the
+# AIDX_TEST_CACHE file carry fresh key strings and fall back to string equality
+_K_FLIGHT_LEG = sys.intern('FlightLeg')
+_K_LEG_DATA = sys.intern('LegData')
+_K_LEG_ID = sys.intern('LegIdentifier')
+_K_AIRLINE = sys.intern('Airline')
+_K_FLIGHT_NUMBER = sys.intern('FlightNumber')
+_K_DEP = sys.intern('DepartureAirport')
+_K_ARR = sys.intern('ArrivalAirport')
+_K_OPS = sys.intern('OperationalStatus')
+_K_TEXT = sys.intern('#text')
+_K_CODE_CONTEXT = sys.intern('@CodeContext')
+
+class FlightInfo(NamedTuple):
+    """
+    Key flight information extracted from one AIDX file.
+    
+    A fixed-layout tuple: fields are read by position, not looked up by key,
+    and each instance is smaller than the equivalent dict. Fields not found
+    in the file keep their defaults. extraction_error holds the exception
+    itself; it is only turned into text (error_message) when reported.
+    
+    Example:
+        FlightInfo(airline='JQ', flight_number='255', flight_type='Arrival',
+                   origin='SYD', destination='MEL', status='On Time')
+    """
+    airline: str = "N/A"
+    flight_number: str = "N/A"
+    flight_type: str = "Unknown"
+    origin: str = "N/A"
+    destination: str = "N/A"
+    status: str = "N/A"
+    extraction_error: Optional[Exception] = None
+    
+    @property
+    def error_message(self) -> Optional[str]:
+        """The extraction error as text, or None when extraction succeeded."""
+        return str(self.extraction_error) if self.extraction_error is not None else None
+
+
+# Flight information read from a FlightLeg: (FlightInfo field, key path in the
+# leg). AIDX carries the airport codes and the status code as element text, e.g.
+# <LegIdentifier><DepartureAirport CodeContext="3">OOL</DepartureAirport> and
+# <LegData><OperationalStatus RepeatIndex="1">OP</OperationalStatus>
+_FLIGHT_LEG_FIELDS = (
+    ('origin', (_K_LEG_ID, _K_DEP, _K_TEXT)),
+    ('destination', (_K_LEG_ID, _K_ARR, _K_TEXT)),
+    ('status', (_K_LEG_DATA, _K_OPS, _K_TEXT)),
+)
+
+
+def _leg_field(flight_leg: Any, key_path: Tuple[str, ...]) -> Any:
+    """
+    Read one _FLIGHT_LEG_FIELDS value from a parsed flight leg.
+    
+    Each step is a plain subscript inside one narrow try: a missing key raises
+    KeyError, and a step that is not a dict (text, or a list of repeated
+    elements) raises TypeError; both mean the value is absent. A '#text' step
+    on a string is the text itself: elements without attributes or children
+    are parsed to their text.
+    
+    Args:
+        flight_leg: Parsed FlightLeg (or LegData) value
+        key_path: Key path from _FLIGHT_LEG_FIELDS
+        
+    Returns:
+        The value at the end of the path, or 'N/A'
+    """
+    try:
+        value = flight_leg
+        for key in key_path:
+            if key == _K_TEXT and type(value) is str:
+                return value
+            value = value[key]
+        return value
+    except (KeyError, TypeError):
+        return 'N/A'
+
+
+def _walk(data: Any, *keys: str, default: Any = None, _type=type, _dict=dict) -> Any:
+    """
+    Follow a path of keys through nested dicts, stopping at the first gap.
+    
+    Each step is one dict.get(), instead of an `in` test followed by a lookup.
+    The parser only produces plain dicts, so the exact type check (a pointer
+    comparison) is used rather than isinstance(). type and dict are bound as
+    defaults (_type, _dict), so each step reads locals instead of builtins.
+    
+    Args:
+        data: Parsed data to start from
+        *keys: Keys to follow, outermost first
+        default: Value returned when a step is missing, None or not a dict
+        
+    Returns:
+        The value at the end of the path, or default
+        
+    Example:
+        _walk(flight_leg, 'LegIdentifier', 'Airline')
+    """
+    for key in keys:
+        if _type(data) is not _dict:
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+# Flight information is read straight from the XML when AIDX_STREAM=1
+_STREAM_EXTRACTION = os.environ.get('AIDX_STREAM') == '1'
+# Top-level elements that hold the flight leg, in lookup order
+_LEG_TAGS = (_K_FLIGHT_LEG, _K_LEG_DATA)
+
+
+def _is_mapping(elem: XMLElement) -> bool:
+    """
+    Whether the parser turns elem into a non-empty dict.
+    
+    That is the case when the element has attributes or child elements;
+    otherwise it becomes its text (an empty string for an empty element).
+    Comments and processing instructions have non-string tags and are ignored.
+    """
+    return bool(elem.attrib) or any(isinstance(child.tag, str) for child in elem)
+
+
+def _only_child(elem: XMLElement, name: str) -> Union[XMLElement, None]:
+    """
+    Return the single child element of elem with the given local name.
+    
+    Repeated children become a list in the parsed data, which the dict
+    extractor treats like a missing key, so they return None here too.
+    
+    Args:
+        elem: Parent element
+        name: Local tag name of the child
+        
+    Returns:
+        The child element, or None when it is missing or repeated
+    """
+    found = None
+    for child in elem:
+        if isinstance(child.tag, str) and _local_name(child.tag) == name:
+            if found is not None:
+                return None
+            found = child
+    return found
+
+
+def _walk_element(elem: XMLElement, key_path: Tuple[str, ...]) -> Union[str, None]:
+    """
+    Follow a _FLIGHT_LEG_FIELDS key path through elements instead of dicts.
+    
+    The path is child names followed by an '@attribute' or '#text' key,
+    matching how _leg_field() follows the same path through the parsed data.
+    
+    Args:
+        elem: Element to start from (the flight leg)
+        key_path: Child names, outermost first, then the '@attribute' or '#text' key
+        
+    Returns:
+        The attribute value or text, or None when a step is missing
+    """
+    *child_names, value_key = key_path
+    for name in child_names:
+        # Only dicts have children in the parsed data
+        if not _is_mapping(elem):
+            return None
+        elem = _only_child(elem, name)
+        if elem is None:
+            return None
+    if value_key == _K_TEXT:
+        # A text-only element is its text (even when empty); an element with
+        # attributes or children only has '#text' when there is text
+        text = (elem.text or '').strip()
+        return text if text or not _is_mapping(elem) else None
+    return elem.get(value_key[1:])
+
+
+def _extract_flight_infos(flight_legs: List[Any]) -> Tuple[List[str], ...]:
+    """
+    Extract origin, destination and status for many flight legs at once.
+    
+    The values come back as parallel lists (one per _FLIGHT_LEG_FIELDS entry)
+    instead of one FlightInfo per leg, so a multi-leg message costs one list
+    slot per field and leg rather than an object per leg. Each value is read
+    the same way as in _extract_flight_info().
+    
+    Args:
+        flight_legs: Parsed FlightLeg values (e.g. the record list returned by
+                     parse_xml_file_streaming)
+        
+    Returns:
+        Tuple of (origins, destinations, statuses), each in the order of
+        flight_legs, with 'N/A' where a leg has no value
+        
+    Example:
+        origins, destinations, statuses = _extract_flight_infos(legs)
+    """
+    columns = tuple([None] * len(flight_legs) for _ in _FLIGHT_LEG_FIELDS)
+    column_paths = tuple(zip(columns, (key_path for _, key_path in _FLIGHT_LEG_FIELDS)))
+    leg_field = _leg_field
+    for index, flight_leg in enumerate(flight_legs):
+        for column, key_path in column_paths:
+            column[index] = leg_field(flight_leg, key_path)
+    return columns
+
+
+def _canonical_json(data: Any) -> bytes:
+    """
+    Serialize data to canonical JSON bytes (sorted keys, compact separators).
+    
+    Equal data always produces the same canonical bytes, so comparing two
+    fingerprints is a single bytes comparison instead of a recursive
+    comparison of two dict trees.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        Canonical UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Files larger than this are memory-mapped rather than read into bytes
+_MMAP_MIN_SIZE = 1024 * 1024
+
+
+@contextmanager
+def _open_xml_bytes(xml_file: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Give access to an XML file's bytes, memory-mapping large files.
+    
+    Small files are read into bytes. Files over _MMAP_MIN_SIZE are mapped
+    read-only, so the parser reads them from the page cache without a copy
+    into a Python bytes object. The mapping is closed when the block exits.
+    
+    Args:
+        xml_file: Path to the XML file
+        
+    Yields:
+        The file content as bytes or a read-only mmap
+    """
+    with open(xml_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+        else:
+            yield f.read()
+
+
+# Free-threaded CPython (3.13t with the GIL disabled) runs threads in parallel,
+# so files are loaded by threads that share their results without pickling
+_FREE_THREADED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+# Parser of each loading thread (free-threaded builds only)
+_thread_state = threading.local()
+
+
+def _worker_parser() -> AIDXParser:
+    """
+    Return the default parser for the current file-loading worker.
+    
+    Worker processes each use their shared _get_parser() instance. Threads
+    running in parallel must not share one parser (the lxml parser object
+    is not thread-safe), so each loading thread builds its own.
+    """
+    if not _FREE_THREADED:
+        return _get_parser()
+    parser = getattr(_thread_state, 'parser', None)
+    if parser is None:
+        parser = _thread_state.parser = AIDXParser()
+    return parser
+
+
+def _load_xml_file(xml_file: str) -> SimpleNamespace:
+    """
+    Check and parse one XML file with the default AIDX parser (runs in a worker).
+    
+    Each stage is stored as it completes. If a stage fails, the exception is
+    stored instead and the later stages are left as None, so the tests that
+    need them can report the original error. The result is picklable, so it
+    can be sent back from the worker.
+    
+    Args:
+        xml_file: Path to the XML file
+        
+    Returns:
+        SimpleNamespace with well_formed (True, or the failure message),
+        et_root (None; filled in by the test process), parsed (AIDX parser output), json (serialized output),
+        fingerprint (canonical JSON of the parsed output), integrity (None;
+        filled in by the test process) and error
+    """
+    worker_parser = _worker_parser()
+    entry = SimpleNamespace(well_formed=None, et_root=None, parsed=None, json=None,
+                            fingerprint=None, integrity=None, error=None)
+    
+    # Well-formedness: stream the file through the reference parser, clearing
+    # each element as it closes, so memory stays bounded by the document depth.
+    # The outcome is stored as a message because lxml errors are not picklable
+    # (lxml's XMLSyntaxError is a subclass of its ParseError)
+    try:
+        element_count = 0
+        for _, elem in ET.iterparse(xml_file, events=('end',)):
+            elem.clear()
+            element_count += 1
+        entry.well_formed = True if element_count else f"XML structure error - No elements parsed: {xml_file}"
+    except ET.ParseError as e:
+        entry.well_formed = f"XML parse error - {e}"
+    except OSError as e:
+        entry.well_formed = f"XML read error - {e}"
+    
+    try:
+        entry.parsed = worker_parser.parse_xml_file(xml_file)
+        entry.json = worker_parser.to_json(entry.parsed)
+        entry.fingerprint = _canonical_json(entry.parsed)
+    except Exception as e:
+        entry.error = e
+    return entry
+
+
+def _timed(test_method):
+    """
+    Decorator that buffers a test's report and records how long it took.
+    
+    The report lines a test appends to self._log are written in one go when the
+    test finishes (passed, failed or skipped), and its duration is stored for
+    the timing summary printed by tearDownClass.
+    
+    Args:
+        test_method: Test method to wrap
+        
+    Returns:
+        Wrapped test method
+    """
+    @wraps(test_method)
+    def wrapper(self):
+        # Report lines are collected here and written once at the end
+        self._log = []
+        start_time = time.perf_counter()
+        try:
+            return test_method(self)
+        finally:
+            type(self)._timings[test_method.__name__] = time.perf_counter() - start_time
+            sys.stdout.write('\n'.join(self._log) + '\n')
+    return wrapper
+
+
+# Separator line used in the suite header and summary
+_BAR = '=' * 80
+
+# Parsed test files are kept here between runs when AIDX_TEST_CACHE=1
+_DISK_CACHE_PATH = Path('.pytest_cache') / 'aidx_cache.pkl'
+
+
+def _available_cpus() -> int:
+    """
+    Return the number of CPUs this process may run on.
+    
+    os.cpu_count() reports every CPU of the machine, even when the process is
+    pinned to fewer (taskset, container CPU sets); starting more workers than
+    usable CPUs only adds process start-up and switching cost. The affinity
+    mask is not available on every platform (e.g. macOS, Windows).
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _load_all_xml_files(xml_files: List[str]) -> List[SimpleNamespace]:
+    """
+    Run _load_xml_file() for every file, across a process pool (a thread pool
+    on free-threaded builds, see _FREE_THREADED).
+    
+    For quick local iterations, setting AIDX_TEST_CACHE=1 keeps the results in
+    a pickle and reuses them while no XML file, the parser module or this test
+    module has changed (name, modification time and size of each). The cache
+    is off by default, so CI runs always parse from scratch.
+    
+    Args:
+        xml_files: Paths of the XML files to load, as strings (cheaper to send
+                   to the workers than Path objects)
+        
+    Returns:
+        List of _load_xml_file() results, in the order of xml_files
+    """
+    use_disk_cache = os.environ.get('AIDX_TEST_CACHE') == '1'
+    if use_disk_cache:
+        sources = list(xml_files) + [aidx_parser.__file__, __file__]
+        fingerprint = tuple((path, stat.st_mtime_ns, stat.st_size)
+                            for path, stat in ((path, os.stat(path)) for path in sources))
+        try:
+            with _DISK_CACHE_PATH.open('rb') as f:
+                cached = pickle.load(f)
+            if cached['fp'] == fingerprint:
+                return cached['data']
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+            pass  # Missing or unreadable cache: parse from scratch
+    
+    # One worker per usable CPU; each worker builds its parser once (_worker_parser)
+    # and reuses it, with its tag caches, for every file it is given
+    workers = max(1, min(_available_cpus(), len(xml_files)))
+    executor_class = ThreadPoolExecutor if _FREE_THREADED else ProcessPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        entries = list(executor.map(_load_xml_file, xml_files, chunksize=4))
+    
+    if use_disk_cache:
+        _DISK_CACHE_PATH.parent.mkdir(exist_ok=True)
+        with _DISK_CACHE_PATH.open('wb') as f:
+            pickle.dump({'fp': fingerprint, 'data': entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return entries
 
 
 class TestAIDXParser(unittest.TestCase):
@@ -55,57 +546,116 @@ class TestAIDXParser(unittest.TestCase):
         1. Locates the XML files directory
         2. Creates a parser instance for testing
         3. Initializes result tracking
-        4. Discovers all XML files to test
-        5. Displays test suite information
+        4. Discovers all XML files to test, in sorted order
+        5. Picks a sample file for the option tests
+        6. Displays test suite information
+        
+        The XML files themselves are parsed on first use (_get_file_cache),
+        so running only the option tests opens just the sample file.
         
         This setup runs once for the entire test class.
         """
         # Define the directory containing XML test files
         cls.xml_folder = Path("AOS xml files")
+        cls.xml_folder_abs = str(cls.xml_folder.absolute())  # Resolved once for the reports
         
         # Create a default parser instance for testing
-        cls.parser = AIDXParser()
+        cls.parser = _get_parser()
         
         # Initialize list to track test results across all tests
         cls.test_results = []
         
-        # Discover all XML files in the test directory
-        cls.xml_files = list(cls.xml_folder.glob("*.xml"))
+        # Duration of each test, reported once by tearDownClass
+        cls._timings = {}
+        
+        # Per-file check records shared by tests 1-6 (built on first use)
+        cls._per_file_records = None
+        
+        # Discover all XML files in the test directory, in a stable order. A
+        # single scandir pass returns each file's type (and caches its stat),
+        # so the accessibility check needs no further lookups by path
+        scanned = {}
+        if cls.xml_folder.is_dir():
+            with os.scandir(cls.xml_folder) as it:
+                scanned = {entry.path: entry for entry in it
+                           if entry.name.endswith('.xml') and not entry.name.startswith('.')}
+        
+        # Sorted once on the path strings, case-insensitively (names differing
+        # only in case keep a fixed order); both str and Path lists are kept
+        cls.xml_file_strs = sorted(scanned, key=lambda path: (path.lower(), path))
+        cls.xml_files = [Path(path) for path in cls.xml_file_strs]
+        cls._dir_entries = {xml_file: scanned[path]
+                            for xml_file, path in zip(cls.xml_files, cls.xml_file_strs)}
+        
+        # Single file used by the option tests, which do not need the whole set
+        cls._sample_file = cls.xml_files[0] if cls.xml_files else None
+        
+        # Parsed results of every XML file (loaded on first use)
+        cls._cache = None
         
         # Display test suite header and information
-        print(f"\n{'='*80}")
-        print(f"AIDX PARSER COMPREHENSIVE TEST SUITE")
-        print(f"{'='*80}")
-        print(f"Found {len(cls.xml_files)} XML files to test")
-        print(f"Test folder: {cls.xml_folder.absolute()}")
-        print(f"{'='*80}\n")
+        sys.stdout.write(f"\n{_BAR}\n"
+                         f"AIDX PARSER COMPREHENSIVE TEST SUITE\n"
+                         f"{_BAR}\n"
+                         f"Found {len(cls.xml_files)} XML files to test\n"
+                         f"Test folder: {cls.xml_folder_abs}\n"
+                         f"{_BAR}\n\n")
     
-    def setUp(self):
+    def _get_file_cache(self) -> Dict[Path, SimpleNamespace]:
         """
-        Set up each individual test.
+        Return the parsed results of every XML file, loading them on first use.
         
-        This method runs before each test method and:
-        1. Records the start time for performance measurement
-        2. Prepares any test-specific resources
+        Each file is read and parsed once, spread across CPU cores (or reused
+        from the on-disk cache, see _load_all_xml_files); tests 1-6 check these
+        shared results, and tests 10-13 compare against them instead of
+        parsing each file again. The structural integrity check runs here
+        too, while both parses of the file are at hand.
         
-        This allows us to track how long each test takes to complete.
+        Returns:
+            Dictionary mapping each XML file to its _load_xml_file() result
         """
-        # Record start time for performance measurement
-        self.start_time = time.time()
+        cls = type(self)
+        if cls._cache is None:
+            entries = _load_all_xml_files(cls.xml_file_strs)
+            
+            # Reference trees cannot be sent between processes (lxml elements are
+            # not picklable), so they are built here. The file bytes go straight to
+            # the parser (no decode pass), and large files are memory-mapped
+            for xml_file, xml_file_str, entry in zip(cls.xml_files, cls.xml_file_strs, entries):
+                if entry.error is None:
+                    try:
+                        with _open_xml_bytes(xml_file_str) as xml_bytes:
+                            entry.et_root = ET.fromstring(xml_bytes)
+                        self._validate_structure_integrity(entry.et_root, entry.parsed, xml_file.name)
+                        entry.integrity = True
+                    except Exception as e:
+                        entry.error = e
+            
+            cls._cache = dict(zip(cls.xml_files, entries))
+        return cls._cache
     
-    def tearDown(self):
+    def _cached(self, xml_file: Path, stage: str) -> Any:
         """
-        Clean up after each individual test.
+        Return one cached stage for a file, re-raising the error that stopped it.
         
-        This method runs after each test method and:
-        1. Calculates elapsed time
-        2. Reports test performance
-        3. Cleans up any test-specific resources
+        Args:
+            xml_file: Path to the XML file
+            stage: Cached attribute name ('et_root', 'parsed', 'json',
+                   'fingerprint' or 'integrity')
+            
+        Returns:
+            The cached value for the stage
+            
+        Raises:
+            Exception: The error stored while loading the file, if the stage never ran
         """
-        # Calculate and display test execution time
-        elapsed = time.time() - self.start_time
-        print(f"   ⏱️  Test completed in {elapsed:.3f}s")
-
+        entry = self._get_file_cache()[xml_file]
+        value = getattr(entry, stage)
+        if value is None:
+            raise entry.error
+        return value
+    
+    @_timed
     def test_01_xml_files_exist(self):
         """
         Test 1: Verify that XML files exist and are accessible.
@@ -118,7 +668,7 @@ class TestAIDXParser(unittest.TestCase):
         
         This is a prerequisite test - if files don't exist, other tests will fail.
         """
-        print("🔍 Test 1: Checking XML file accessibility...")
+        self._log.append("🔍 Test 1: Checking XML file accessibility...")
         
         # Verify the XML directory exists
         self.assertTrue(self.xml_folder.exists(), 
@@ -128,22 +678,16 @@ class TestAIDXParser(unittest.TestCase):
         self.assertGreater(len(self.xml_files), 0, 
                           "No XML files found in the test directory")
         
-        # Check each XML file individually
-        for xml_file in self.xml_files:
-            # Verify file exists
-            self.assertTrue(xml_file.exists(), 
-                           f"XML file does not exist: {xml_file}")
-            
-            # Verify it's actually a file (not a directory)
-            self.assertTrue(xml_file.is_file(), 
-                           f"Path is not a file: {xml_file}")
-            
-            # Verify file is readable
-            self.assertTrue(xml_file.stat().st_size > 0, 
-                           f"XML file is empty: {xml_file}")
+        # Check each XML file individually (exists, is a file, not empty)
+        inaccessible_files = self._check_column('accessible')
         
-        print(f"   ✅ All {len(self.xml_files)} XML files are accessible")
+        # Assert that every file is accessible
+        if inaccessible_files:
+            self.fail(inaccessible_files[0][1])
+        
+        self._log.append(f"   ✅ All {len(self.xml_files)} XML files are accessible")
 
+    @_timed
     def test_02_xml_well_formed(self):
         """
         Test 2: Verify that all XML files are well-formed and valid.
@@ -156,36 +700,10 @@ class TestAIDXParser(unittest.TestCase):
         
         Well-formed XML is a prerequisite for successful AIDX parsing.
         """
-        print("🔍 Test 2: Validating XML well-formedness...")
-        
-        # Track files that fail XML validation
-        failed_files = []
+        self._log.append("🔍 Test 2: Validating XML well-formedness...")
         
-        # Test each XML file for well-formedness
-        for xml_file in self.xml_files:
-            try:
-                # Attempt to parse XML using ElementTree
-                # This will raise ParseError if XML is malformed
-                with open(xml_file, 'r', encoding='utf-8') as f:
-                    xml_content = f.read()
-                
-                # Parse the XML content
-                root = ET.fromstring(xml_content)
-                
-                # Verify we got a valid root element
-                self.assertIsNotNone(root, f"Failed to parse root element: {xml_file}")
-                
-                print(f"   ✅ {xml_file.name}: Well-formed XML")
-                
-            except ET.ParseError as e:
-                # XML parsing failed - record the failure
-                failed_files.append((xml_file, str(e)))
-                print(f"   ❌ {xml_file.name}: XML parse error - {e}")
-                
-            except Exception as e:
-                # Other errors (file reading, encoding, etc.)
-                failed_files.append((xml_file, str(e)))
-                print(f"   ❌ {xml_file.name}: Unexpected error - {e}")
+        # Files that failed XML validation in the per-file checks
+        failed_files = self._check_column('well_formed', "Well-formed XML")
         
         # Assert that no files failed XML validation
         if failed_files:
@@ -193,8 +711,9 @@ class TestAIDXParser(unittest.TestCase):
             failure_details = newline.join([f"  - {file}: {error}" for file, error in failed_files])
             self.fail(f"XML validation failed for {len(failed_files)} files:{newline}{failure_details}")
         
-        print(f"   ✅ All {len(self.xml_files)} XML files are well-formed")
+        self._log.append(f"   ✅ All {len(self.xml_files)} XML files are well-formed")
 
+    @_timed
     def test_03_parser_basic_functionality(self):
         """
         Test 3: Test basic AIDX parser functionality on all XML files.
@@ -207,54 +726,23 @@ class TestAIDXParser(unittest.TestCase):
         
         This is the core functionality test for the AIDX parser.
         """
-        print("🔍 Test 3: Testing basic parser functionality...")
+        self._log.append("🔍 Test 3: Testing basic parser functionality...")
         
-        # Track parsing failures
-        failed_parses = []
-        successful_parses = 0
-        
-        # Test parsing each XML file
-        for xml_file in self.xml_files:
-            try:
-                # Attempt to parse the XML file using our AIDX parser
-                parsed_data = self.parser.parse_xml_file(xml_file)
-                
-                # Verify we got a valid result
-                self.assertIsInstance(parsed_data, dict, 
-                                    f"Parser should return dict, got {type(parsed_data)}")
-                
-                # Verify the result is not empty
-                self.assertGreater(len(parsed_data), 0, 
-                                 f"Parsed data should not be empty for {xml_file}")
-                
-                # Verify we have a root element
-                root_keys = list(parsed_data.keys())
-                self.assertEqual(len(root_keys), 1, 
-                               f"Should have exactly one root key, got {len(root_keys)}")
-                
-                successful_parses += 1
-                print(f"   ✅ {xml_file.name}: Successfully parsed")
-                
-            except AIDXParseError as e:
-                # AIDX parser specific error
-                failed_parses.append((xml_file, f"AIDX Parse Error: {e}"))
-                print(f"   ❌ {xml_file.name}: AIDX parse error - {e}")
-                
-            except Exception as e:
-                # Any other unexpected error
-                failed_parses.append((xml_file, f"Unexpected Error: {e}"))
-                print(f"   ❌ {xml_file.name}: Unexpected error - {e}")
+        # Files the parser failed on in the per-file checks
+        failed_parses = self._check_column('parsed', "Successfully parsed")
+        successful_parses = len(self.xml_files) - len(failed_parses)
         
         # Report results and assert success
-        print(f"   📊 Successfully parsed: {successful_parses}/{len(self.xml_files)} files")
+        self._log.append(f"   📊 Successfully parsed: {successful_parses}/{len(self.xml_files)} files")
         
         if failed_parses:
             newline = '\n'  # Variable to handle newlines in f-strings
             failure_details = newline.join([f"  - {file}: {error}" for file, error in failed_parses])
             self.fail(f"Parser failed for {len(failed_parses)} files:{newline}{failure_details}")
         
-        print(f"   ✅ All {len(self.xml_files)} files parsed successfully")
+        self._log.append(f"   ✅ All {len(self.xml_files)} files parsed successfully")
 
+    @_timed
     def test_04_json_serialization(self):
         """
         Test 4: Test JSON serialization of parsed data.
@@ -264,67 +752,52 @@ class TestAIDXParser(unittest.TestCase):
         2. JSON serialization doesn't lose data
         3. JSON output is valid and well-formed
         4. No serialization errors occur
+        5. Output is identical with and without orjson installed
+        6. to_json_bytes() is to_json() encoded as UTF-8
         
         JSON serialization is important for API integration and data exchange.
         """
-        print("🔍 Test 4: Testing JSON serialization...")
+        self._log.append("🔍 Test 4: Testing JSON serialization...")
         
-        # Track serialization failures
-        failed_serializations = []
-        successful_serializations = 0
-        
-        # Test JSON serialization for each XML file
-        for xml_file in self.xml_files:
-            try:
-                # Parse the XML file first
-                parsed_data = self.parser.parse_xml_file(xml_file)
-                
-                # Convert to JSON using parser's method
-                json_output = self.parser.to_json(parsed_data)
-                
-                # Verify JSON output is a string
-                self.assertIsInstance(json_output, str, 
-                                    f"JSON output should be string, got {type(json_output)}")
-                
-                # Verify JSON is not empty
-                self.assertGreater(len(json_output), 0, 
-                                 f"JSON output should not be empty for {xml_file}")
-                
-                # Verify JSON is valid by parsing it back
-                reparsed_data = json.loads(json_output)
-                
-                # Verify reparsed data matches original
-                self.assertEqual(parsed_data, reparsed_data, 
-                               f"JSON round-trip failed for {xml_file}")
-                
-                successful_serializations += 1
-                print(f"   ✅ {xml_file.name}: JSON serialization successful")
-                
-            except json.JSONDecodeError as e:
-                # JSON parsing failed
-                failed_serializations.append((xml_file, f"Invalid JSON: {e}"))
-                print(f"   ❌ {xml_file.name}: Invalid JSON - {e}")
-                
-            except AIDXParseError as e:
-                # AIDX parsing failed
-                failed_serializations.append((xml_file, f"Parse Error: {e}"))
-                print(f"   ❌ {xml_file.name}: Parse error - {e}")
-                
-            except Exception as e:
-                # Any other error
-                failed_serializations.append((xml_file, f"Unexpected Error: {e}"))
-                print(f"   ❌ {xml_file.name}: Unexpected error - {e}")
+        # Files whose JSON round-trip failed in the per-file checks
+        failed_serializations = self._check_column('json', "JSON serialization successful")
+        successful_serializations = len(self.xml_files) - len(failed_serializations)
         
         # Report results and assert success
-        print(f"   📊 Successfully serialized: {successful_serializations}/{len(self.xml_files)} files")
+        self._log.append(f"   📊 Successfully serialized: {successful_serializations}/{len(self.xml_files)} files")
         
         if failed_serializations:
             newline = '\n'  # Variable to handle newlines in f-strings
             failure_details = newline.join([f"  - {file}: {error}" for file, error in failed_serializations])
             self.fail(f"JSON serialization failed for {len(failed_serializations)} files:{newline}{failure_details}")
         
-        print(f"   ✅ All {len(self.xml_files)} files serialized to JSON successfully")
+        self._log.append(f"   ✅ All {len(self.xml_files)} files serialized to JSON successfully")
+        
+        # The optional orjson encoder must not change the output, including for
+        # nesting deeper than orjson supports (the stdlib backend builds such trees)
+        deep = 'x'
+        for _ in range(300):
+            deep = {'n': deep}
+        samples = [self._cached(xml_file, 'parsed') for xml_file in self.xml_files]
+        samples += [{'a': 'b', 'c': ['1', '2'], 'd': {}, 'e': 'ü\x01"'}, deep]
+        for indent in (2, None, 4):
+            default_output = [self.parser.to_json(sample, indent=indent) for sample in samples]
+            with mock.patch.object(aidx_parser, 'orjson', None):
+                stdlib_output = [self.parser.to_json(sample, indent=indent) for sample in samples]
+                stdlib_bytes = [self.parser.to_json_bytes(sample, indent=indent) for sample in samples]
+            default_bytes = [self.parser.to_json_bytes(sample, indent=indent) for sample in samples]
+            self.assertEqual(default_output, stdlib_output,
+                             f"JSON output depends on the encoder (indent={indent})")
+            
+            # The bytes variant is the same document under either encoder
+            expected_bytes = [text.encode('utf-8') for text in default_output]
+            self.assertEqual(default_bytes, expected_bytes,
+                             f"to_json_bytes() differs from to_json() (indent={indent})")
+            self.assertEqual(stdlib_bytes, expected_bytes,
+                             f"to_json_bytes() differs from to_json() without orjson (indent={indent})")
+        self._log.append(f"   ✅ JSON output is identical with and without orjson, as str and bytes")
 
+    @_timed
     def test_05_data_integrity(self):
         """
         Test 5: Validate data integrity between original XML and parsed output.
@@ -337,51 +810,23 @@ class TestAIDXParser(unittest.TestCase):
         
         Data integrity is crucial for ensuring the parser accurately represents the original XML.
         """
-        print("🔍 Test 5: Validating data integrity...")
+        self._log.append("🔍 Test 5: Validating data integrity...")
         
-        # Track integrity validation failures
-        failed_validations = []
-        successful_validations = 0
-        
-        # Test data integrity for each XML file
-        for xml_file in self.xml_files:
-            try:
-                # Parse XML with both ElementTree (reference) and our parser
-                with open(xml_file, 'r', encoding='utf-8') as f:
-                    xml_content = f.read()
-                
-                # Parse with ElementTree for comparison
-                et_root = ET.fromstring(xml_content)
-                
-                # Parse with our AIDX parser
-                parsed_data = self.parser.parse_xml_file(xml_file)
-                
-                # Validate structure integrity
-                self._validate_structure_integrity(et_root, parsed_data, xml_file.name)
-                
-                successful_validations += 1
-                print(f"   ✅ {xml_file.name}: Data integrity validated")
-                
-            except AssertionError as e:
-                # Integrity validation failed
-                failed_validations.append((xml_file, f"Integrity Error: {e}"))
-                print(f"   ❌ {xml_file.name}: Integrity error - {e}")
-                
-            except Exception as e:
-                # Any other error
-                failed_validations.append((xml_file, f"Unexpected Error: {e}"))
-                print(f"   ❌ {xml_file.name}: Unexpected error - {e}")
+        # Files that failed integrity validation in the per-file checks
+        failed_validations = self._check_column('integrity', "Data integrity validated")
+        successful_validations = len(self.xml_files) - len(failed_validations)
         
         # Report results and assert success
-        print(f"   📊 Successfully validated: {successful_validations}/{len(self.xml_files)} files")
+        self._log.append(f"   📊 Successfully validated: {successful_validations}/{len(self.xml_files)} files")
         
         if failed_validations:
             newline = '\n'  # Variable to handle newlines in f-strings
             failure_details = newline.join([f"  - {file}: {error}" for file, error in failed_validations])
             self.fail(f"Data integrity validation failed for {len(failed_validations)} files:{newline}{failure_details}")
         
-        print(f"   ✅ All {len(self.xml_files)} files passed data integrity validation")
+        self._log.append(f"   ✅ All {len(self.xml_files)} files passed data integrity validation")
 
+    @_timed
     def test_06_flight_data_extraction(self):
         """
         Test 6: Test extraction of key flight data from parsed XML.
@@ -394,43 +839,51 @@ class TestAIDXParser(unittest.TestCase):
         
         This test validates that the parser produces usable data for flight operations.
         """
-        print("🔍 Test 6: Testing flight data extraction...")
+        self._log.append("🔍 Test 6: Testing flight data extraction...")
         
         # Track extraction results
         extraction_results = []
-        successful_extractions = 0
+        records = self._get_per_file_records()
         
-        # Test flight data extraction for each XML file
-        for xml_file in self.xml_files:
-            try:
-                # Parse the XML file
-                parsed_data = self.parser.parse_xml_file(xml_file)
-                
-                # Extract flight information
-                flight_info = self._extract_flight_info(parsed_data, xml_file.name)
-                
-                # Verify we extracted some flight information
-                self.assertIsInstance(flight_info, dict, 
-                                    f"Flight info should be dict, got {type(flight_info)}")
-                
+        # Count successes in one pass over the records rather than per-file increments
+        successful_extractions = sum(isinstance(record['flight_info'], FlightInfo) for record in records.values())
+        
+        # Flight information extracted for each XML file in the per-file checks
+        for xml_file, record in records.items():
+            flight_info = record['flight_info']
+            
+            if isinstance(flight_info, FlightInfo):
                 # Store extraction results for reporting
                 extraction_results.append((xml_file.name, flight_info))
-                successful_extractions += 1
                 
                 # Display extracted flight information
-                airline = flight_info.get('airline', 'N/A')
-                flight_num = flight_info.get('flight_number', 'N/A')
-                flight_type = flight_info.get('flight_type', 'N/A')
-                
-                print(f"   ✅ {xml_file.name}: {airline} {flight_num} ({flight_type})")
-                
-            except Exception as e:
+                self._log.append(f"   ✅ {xml_file.name}: {flight_info.airline} "
+                                 f"{flight_info.flight_number} ({flight_info.flight_type}) "
+                                 f"{flight_info.origin}→{flight_info.destination} [{flight_info.status}]")
+                if flight_info.extraction_error is not None:
+                    self._log.append(f"   ⚠️  {xml_file.name}: Partial extraction - {flight_info.error_message}")
+            else:
                 # Extraction failed
-                print(f"   ❌ {xml_file.name}: Extraction error - {e}")
-                extraction_results.append((xml_file.name, {"error": str(e)}))
+                self._log.append(f"   ❌ {xml_file.name}: Extraction error - {flight_info}")
+                extraction_results.append((xml_file.name, {"error": flight_info}))
+        
+        # The streaming extractor must read the same flight information from the XML
+        # (files the parser could not parse have no dict result to compare with)
+        file_cache = self._get_file_cache()
+        resolved_files = 0
+        for xml_file, record in records.items():
+            if isinstance(record['flight_info'], FlightInfo) and file_cache[xml_file].parsed is not None:
+                flight_info = self._extract_flight_info(self._cached(xml_file, 'parsed'), xml_file.name)
+                self.assertEqual(self._extract_flight_info_stream(xml_file), flight_info,
+                                 f"Streaming flight info differs for {xml_file.name}")
+                resolved_files += 'N/A' not in (flight_info.origin, flight_info.destination, flight_info.status)
+        
+        # The comparison must cover real values, not only two sets of defaults
+        self.assertGreater(resolved_files, 0,
+                           "No file has origin, destination and status for the streaming comparison")
         
         # Report extraction statistics
-        print(f"   📊 Successfully extracted flight data: {successful_extractions}/{len(self.xml_files)} files")
+        self._log.append(f"   📊 Successfully extracted flight data: {successful_extractions}/{len(self.xml_files)} files")
         
         # Store results for final reporting
         self.test_results.extend(extraction_results)
@@ -440,8 +893,178 @@ class TestAIDXParser(unittest.TestCase):
         self.assertGreater(success_rate, 0.8, 
                           f"Flight data extraction success rate too low: {success_rate:.2%}")
         
-        print(f"   ✅ Flight data extraction completed with {success_rate:.1%} success rate")
+        self._log.append(f"   ✅ Flight data extraction completed with {success_rate:.1%} success rate")
 
+    def _get_per_file_records(self) -> Dict[Path, Dict[str, Any]]:
+        """
+        Return the per-file check records, running the checks on first use.
+        
+        Tests 1-6 share one pass over the XML files: the first of them to run
+        performs every check for every file, and the rest read its records.
+        
+        Returns:
+            Dictionary mapping each XML file to its check record
+        """
+        cls = type(self)
+        if cls._per_file_records is None:
+            cls._per_file_records = {xml_file: self._run_all_checks_for(xml_file)
+                                     for xml_file in self.xml_files}
+        return cls._per_file_records
+    
+    def _check_column(self, column: str, success_message: str = None) -> List[Tuple[Path, str]]:
+        """
+        Report one check from the per-file records and collect its failures.
+        
+        Args:
+            column: Name of the check in each record (e.g. 'parsed')
+            success_message: Message printed for each passing file (None prints
+                             failures only)
+            
+        Returns:
+            List of (file, error message) tuples for the files that failed
+        """
+        failures = []
+        for xml_file, record in self._get_per_file_records().items():
+            outcome = record[column]
+            if outcome is True:
+                if success_message:
+                    self._log.append(f"   ✅ {xml_file.name}: {success_message}")
+            else:
+                failures.append((xml_file, outcome))
+                self._log.append(f"   ❌ {xml_file.name}: {outcome}")
+        return failures
+    
+    def _run_all_checks_for(self, xml_file: Path) -> Dict[str, Any]:
+        """
+        Run every per-file check of tests 1-6 against one XML file.
+        
+        This method performs, in a single pass over the file:
+        1. Accessibility (is a file, not empty)
+        2. Well-formedness (streamed through the reference XML parser in
+           the loader workers, alongside the AIDX parse)
+        3. AIDX parsing (structure of the parsed data)
+        4. JSON serialization round-trip
+        5. Data integrity against the reference tree
+        6. Flight data extraction
+        
+        Args:
+            xml_file: Path to the XML file
+            
+        Files that fail the accessibility check are not parsed, so the checks
+        after it only handle the errors they expect; anything else is a bug
+        and propagates as a test error.
+        
+        Returns:
+            Dictionary with one entry per check: True when the check passed,
+            otherwise the error message. 'flight_info' holds the extracted
+            FlightInfo, or the error message.
+        """
+        record = {}
+        
+        # Check 1: File accessibility (pre-validation for the parsing checks),
+        # answered from the directory entry found by setUpClass
+        dir_entry = self._dir_entries[xml_file]
+        if not dir_entry.is_file():
+            record['accessible'] = f"Path is not a file: {xml_file}"
+        elif not dir_entry.stat().st_size > 0:
+            record['accessible'] = f"XML file is empty: {xml_file}"
+        else:
+            record['accessible'] = True
+        
+        # An inaccessible file fails every other check without being parsed
+        if record['accessible'] is not True:
+            skipped = f"Not checked - {record['accessible']}"
+            record.update(well_formed=skipped, parsed=skipped, json=skipped,
+                          integrity=skipped, flight_info=skipped)
+            return record
+        
+        # Check 2: XML well-formedness (streamed in the loader workers)
+        record['well_formed'] = self._get_file_cache()[xml_file].well_formed
+        
+        # Check 3: Basic AIDX parsing
+        try:
+            # Result of parsing the XML file with our AIDX parser
+            parsed_data = self._cached(xml_file, 'parsed')
+            
+            # Verify we got a valid, non-empty result
+            self.assertIsInstance(parsed_data, dict, 
+                                f"Parser should return dict, got {type(parsed_data)}")
+            self.assertGreater(len(parsed_data), 0, 
+                             f"Parsed data should not be empty for {xml_file}")
+            
+            # Verify we have a root element
+            root_keys = list(parsed_data.keys())
+            self.assertEqual(len(root_keys), 1, 
+                           f"Should have exactly one root key, got {len(root_keys)}")
+            record['parsed'] = True
+        except AIDXParseError as e:
+            # AIDX parser specific error
+            record['parsed'] = f"AIDX Parse Error: {e}"
+        except AssertionError as e:
+            # Parsed data has an unexpected structure
+            record['parsed'] = f"Structure Error: {e}"
+        
+        # Check 4: JSON serialization
+        try:
+            # JSON from the parser's to_json method
+            json_output = self._cached(xml_file, 'json')
+            
+            # Verify JSON output is a non-empty string
+            self.assertIsInstance(json_output, str, 
+                                f"JSON output should be string, got {type(json_output)}")
+            self.assertGreater(len(json_output), 0, 
+                             f"JSON output should not be empty for {xml_file}")
+            
+            # Verify JSON is valid by parsing it back, and that it matches the original.
+            # The original's canonical fingerprint was computed with the cache, so
+            # this is one bytes comparison instead of comparing two dict trees
+            fingerprint = self._cached(xml_file, 'fingerprint')
+            roundtrip = _canonical_json(json.loads(json_output))
+            self.assertTrue(fingerprint == roundtrip, 
+                           f"JSON round-trip failed for {xml_file}")
+            record['json'] = True
+        except json.JSONDecodeError as e:
+            # JSON parsing failed
+            record['json'] = f"Invalid JSON: {e}"
+        except AIDXParseError as e:
+            # AIDX parsing failed
+            record['json'] = f"Parse Error: {e}"
+        except AssertionError as e:
+            # JSON output is wrong or does not round-trip
+            record['json'] = f"Serialization Error: {e}"
+        
+        # Check 5: Data integrity
+        try:
+            # Structure integrity, validated when the file was loaded
+            # (re-raises the AssertionError if it failed)
+            self._cached(xml_file, 'integrity')
+            record['integrity'] = True
+        except AssertionError as e:
+            # Integrity validation failed
+            record['integrity'] = f"Integrity Error: {e}"
+        except (AIDXParseError, ET.ParseError) as e:
+            # Either parse of the file failed, so there is nothing to compare
+            record['integrity'] = f"Parse Error: {e}"
+        
+        # Check 6: Flight data extraction
+        try:
+            # Extract flight information from the parsed XML file (or from the XML itself)
+            if _STREAM_EXTRACTION:
+                flight_info = self._extract_flight_info_stream(xml_file)
+            else:
+                flight_info = self._extract_flight_info(self._cached(xml_file, 'parsed'), xml_file.name)
+            
+            # Verify we extracted some flight information
+            self.assertIsInstance(flight_info, FlightInfo, 
+                                f"Flight info should be FlightInfo, got {type(flight_info)}")
+            record['flight_info'] = flight_info
+        except Exception as e:
+            # Extraction failed
+            record['flight_info'] = str(e)
+        
+        return record
+
+    @_timed
     def test_07_parser_options(self):
         """
         Test 7: Test various parser configuration options.
@@ -454,52 +1077,66 @@ class TestAIDXParser(unittest.TestCase):
         
         This validates the parser's configurability and flexibility.
         """
-        print("🔍 Test 7: Testing parser configuration options...")
+        self._log.append("🔍 Test 7: Testing parser configuration options...")
         
-        # Use first available XML file for testing options
-        if not self.xml_files:
+        # Use the sample XML file for testing options
+        if self._sample_file is None:
             self.skipTest("No XML files available for testing parser options")
         
-        test_file = self.xml_files[0]
+        test_file = self._sample_file
         
         # Test 1: Default parser configuration
         try:
-            default_parser = AIDXParser()
+            default_parser = _get_parser()
             default_data = default_parser.parse_xml_file(test_file)
             self.assertIsInstance(default_data, dict)
-            print(f"   ✅ Default parser configuration works")
+            self._log.append(f"   ✅ Default parser configuration works")
         except Exception as e:
             self.fail(f"Default parser configuration failed: {e}")
         
         # Test 2: Parser with skip_tags option
         try:
-            skip_parser = AIDXParser(skip_tags=['TPA_Extension'])
+            skip_parser = _get_parser(skip_tags=['TPA_Extension'])
             skip_data = skip_parser.parse_xml_file(test_file)
             self.assertIsInstance(skip_data, dict)
-            print(f"   ✅ Parser with skip_tags option works")
+            self._log.append(f"   ✅ Parser with skip_tags option works")
         except Exception as e:
             self.fail(f"Parser with skip_tags failed: {e}")
         
         # Test 3: Parser with include_only_tags option
         try:
-            include_parser = AIDXParser(include_only_tags=['FlightLeg'])
+            include_parser = _get_parser(include_only_tags=['FlightLeg'])
             include_data = include_parser.parse_xml_file(test_file)
             self.assertIsInstance(include_data, dict)
-            print(f"   ✅ Parser with include_only_tags option works")
+            self._log.append(f"   ✅ Parser with include_only_tags option works")
         except Exception as e:
             self.fail(f"Parser with include_only_tags failed: {e}")
         
         # Test 4: Parser with namespace preservation
         try:
-            ns_parser = AIDXParser(preserve_namespaces=True)
+            ns_parser = _get_parser(preserve_namespaces=True)
             ns_data = ns_parser.parse_xml_file(test_file)
             self.assertIsInstance(ns_data, dict)
-            print(f"   ✅ Parser with namespace preservation works")
+            self._log.append(f"   ✅ Parser with namespace preservation works")
         except Exception as e:
             self.fail(f"Parser with namespace preservation failed: {e}")
         
-        print(f"   ✅ All parser configuration options work correctly")
+        # Test 5: Parser without attributes (specialized walker) matches the general walker
+        try:
+            no_attr_parser = _get_parser(include_attributes=False)
+            for xml_file in self.xml_files:
+                root = ET.parse(xml_file).getroot()
+                self.assertEqual(no_attr_parser._parse_element(root),
+                                 AIDXParser._parse_element(no_attr_parser, root),
+                                 f"Attribute-free output differs for {xml_file}")
+            self.assertNotIn('"@', no_attr_parser.to_json(no_attr_parser.parse_xml_file(test_file)))
+            self._log.append(f"   ✅ Parser without attributes works")
+        except Exception as e:
+            self.fail(f"Parser without attributes failed: {e}")
+        
+        self._log.append(f"   ✅ All parser configuration options work correctly")
 
+    @_timed
     def test_08_convenience_function(self):
         """
         Test 8: Test the convenience parse_aidx function.
@@ -512,18 +1149,18 @@ class TestAIDXParser(unittest.TestCase):
         
         The convenience function provides a simple interface for common parsing tasks.
         """
-        print("🔍 Test 8: Testing convenience function...")
+        self._log.append("🔍 Test 8: Testing convenience function...")
         
-        if not self.xml_files:
+        if self._sample_file is None:
             self.skipTest("No XML files available for testing convenience function")
         
-        test_file = self.xml_files[0]
+        test_file = self._sample_file
         
         # Test 1: Parse file to dictionary
         try:
             dict_result = parse_aidx(test_file, output_format='dict')
             self.assertIsInstance(dict_result, dict)
-            print(f"   ✅ Convenience function: file to dict works")
+            self._log.append(f"   ✅ Convenience function: file to dict works")
         except Exception as e:
             self.fail(f"Convenience function (file to dict) failed: {e}")
         
@@ -533,20 +1170,45 @@ class TestAIDXParser(unittest.TestCase):
             self.assertIsInstance(json_result, str)
             # Verify it's valid JSON
             json.loads(json_result)
-            print(f"   ✅ Convenience function: file to JSON works")
+            self._log.append(f"   ✅ Convenience function: file to JSON works")
         except Exception as e:
             self.fail(f"Convenience function (file to JSON) failed: {e}")
+
+        # Test 2b: Parse file to JSON bytes (same document, UTF-8 encoded)
+        try:
+            bytes_json = parse_aidx(test_file, output_format='json_bytes')
+            self.assertIsInstance(bytes_json, bytes)
+            self.assertEqual(bytes_json, json_result.encode('utf-8'))
+            self._log.append(f"   ✅ Convenience function: file to JSON bytes works")
+        except Exception as e:
+            self.fail(f"Convenience function (file to JSON bytes) failed: {e}")
         
         # Test 3: Parse with custom options
         try:
             custom_result = parse_aidx(test_file, skip_tags=['TPA_Extension'])
             self.assertIsInstance(custom_result, dict)
-            print(f"   ✅ Convenience function: custom options work")
+            self._log.append(f"   ✅ Convenience function: custom options work")
         except Exception as e:
             self.fail(f"Convenience function (custom options) failed: {e}")
-        
-        print(f"   ✅ Convenience function works correctly")
 
+        # Test 4: Parse raw bytes, string paths and other path-like objects to the
+        # same result as a Path
+        try:
+            bytes_result = parse_aidx(test_file.read_bytes())
+            str_path_result = parse_aidx(str(test_file))
+            with os.scandir(test_file.parent) as it:
+                dir_entry = next(entry for entry in it if entry.name == test_file.name)
+            path_like_result = parse_aidx(dir_entry)
+            self.assertEqual(bytes_result, dict_result)
+            self.assertEqual(str_path_result, dict_result)
+            self.assertEqual(path_like_result, dict_result)
+            self._log.append(f"   ✅ Convenience function: bytes, string path and path-like input work")
+        except Exception as e:
+            self.fail(f"Convenience function (bytes/string path/path-like input) failed: {e}")
+
+        self._log.append(f"   ✅ Convenience function works correctly")
+
+    @_timed
     def test_09_error_handling(self):
         """
         Test 9: Test parser error handling with invalid inputs.
@@ -559,13 +1221,13 @@ class TestAIDXParser(unittest.TestCase):
         
         Robust error handling is essential for production use.
         """
-        print("🔍 Test 9: Testing error handling...")
+        self._log.append("🔍 Test 9: Testing error handling...")
         
         # Test 1: Invalid XML string
         try:
             with self.assertRaises(AIDXParseError):
                 self.parser.parse_xml_string("<invalid>xml<content>")
-            print(f"   ✅ Invalid XML string handling works")
+            self._log.append(f"   ✅ Invalid XML string handling works")
         except Exception as e:
             self.fail(f"Invalid XML string test failed: {e}")
         
@@ -573,7 +1235,7 @@ class TestAIDXParser(unittest.TestCase):
         try:
             with self.assertRaises(AIDXParseError):
                 self.parser.parse_xml_string("")
-            print(f"   ✅ Empty XML string handling works")
+            self._log.append(f"   ✅ Empty XML string handling works")
         except Exception as e:
             self.fail(f"Empty XML string test failed: {e}")
         
@@ -581,13 +1243,238 @@ class TestAIDXParser(unittest.TestCase):
         try:
             with self.assertRaises(AIDXParseError):
                 self.parser.parse_xml_file("non_existent_file.xml")
-            print(f"   ✅ Non-existent file handling works")
+            self._log.append(f"   ✅ Non-existent file handling works")
         except Exception as e:
             self.fail(f"Non-existent file test failed: {e}")
         
-        print(f"   ✅ Error handling works correctly")
+        # Test 4: Malformed existing file reports the file's own parse error
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                bad_file = Path(temp_dir) / "malformed.xml"
+                bad_file.write_text("<invalid>xml<content>", encoding="utf-8")
+                with self.assertRaises(AIDXParseError) as context:
+                    parse_aidx(str(bad_file))
+                self.assertIn(str(bad_file), str(context.exception))
+            self._log.append(f"   ✅ Malformed file handling works")
+        except Exception as e:
+            self.fail(f"Malformed file test failed: {e}")
+        
+        # Test 5: Input that is neither XML nor a usable path still raises AIDXParseError,
+        # while an unsupported input type is a caller error
+        try:
+            # Too long for a file name (ENAMETOOLONG) and not XML
+            with self.assertRaises(AIDXParseError):
+                parse_aidx("x" * 100_000)
+            with self.assertRaises(TypeError):
+                parse_aidx(12345)
+            self._log.append(f"   ✅ Non-XML content and unsupported input handling works")
+        except Exception as e:
+            self.fail(f"Non-XML content test failed: {e}")
+        
+        # Test 6: In-memory entry points report malformed content the same way
+        try:
+            malformed = "<invalid>xml<content>"
+            malformed_bytes = malformed.encode('utf-8')
+            messages = []
+            for parse in (lambda: self.parser.parse_xml_string(malformed),
+                          lambda: self.parser.parse_xml_bytes(malformed_bytes),
+                          lambda: self.parser.parse_xml_stream([malformed_bytes])):
+                with self.assertRaises(AIDXParseError) as context:
+                    parse()
+                messages.append(str(context.exception))
+            self.assertEqual(len(set(messages)), 1, f"Error messages differ: {messages}")
+            self._log.append(f"   ✅ String, bytes and stream errors match")
+        except Exception as e:
+            self.fail(f"Entry point error test failed: {e}")
+        
+        self._log.append(f"   ✅ Error handling works correctly")
+
+    @_timed
+    def test_10_streaming_parse(self):
+        """
+        Test 10: Test incremental (streaming) parsing of XML files.
+
+        This test ensures that:
+        1. Streaming parse produces the same data as the tree parser
+        2. Record elements (FlightLeg) are always collected into a list
+        3. Batch flight extraction over the records matches per-file extraction
+        4. Disabling record streaming falls back to the tree parser
+        5. Records keep their key position, and records in filtered subtrees or
+           inside another record are not collected
 
-    def _validate_structure_integrity(self, et_element: ET.Element, parsed_data: Dict[str, Any], filename: str):
+        Streaming keeps memory bounded on large multi-record AIDX files.
+        """
+        self._log.append("🔍 Test 10: Testing streaming parser...")
+
+        # Compare streaming output with the tree parser for each XML file
+        for xml_file in self.xml_files:
+            # The tree parse is shared with tests 1-6; only the streaming parse runs here
+            tree_data = self._cached(xml_file, 'parsed')
+            stream_data = self.parser.parse_xml_file_streaming(xml_file)
+
+            # Streaming always returns records as a list under the root element
+            root_tag = list(tree_data.keys())[0]
+            expected = dict(tree_data[root_tag])
+            if 'FlightLeg' in expected:
+                flight_legs = expected['FlightLeg']
+                expected['FlightLeg'] = flight_legs if isinstance(flight_legs, list) else [flight_legs]
+
+            self.assertEqual(stream_data, {root_tag: expected},
+                             f"Streaming output differs for {xml_file}")
+            self.assertEqual(list(stream_data[root_tag]), list(expected),
+                             f"Streaming key order differs for {xml_file}")
+
+            # Batch extraction over the streamed records matches per-file extraction
+            if 'FlightLeg' in expected:
+                flight_legs = stream_data[root_tag]['FlightLeg']
+                origins, destinations, statuses = _extract_flight_infos(flight_legs)
+                self.assertEqual(len(origins), len(flight_legs))
+                if len(flight_legs) == 1:
+                    flight_info = self._extract_flight_info(tree_data, xml_file.name)
+                    self.assertEqual((origins[0], destinations[0], statuses[0]),
+                                     (flight_info.origin, flight_info.destination, flight_info.status),
+                                     f"Batch flight info differs for {xml_file}")
+
+            # Without a record tag the tree parser is used
+            self.assertEqual(self.parser.parse_xml_file_streaming(xml_file, record_tag=None), tree_data)
+
+            # Skipped subtrees are dropped while streaming without changing the result
+            skip_parser = _get_parser(skip_tags=['TPA_Extension'])
+            skip_stream = skip_parser.parse_xml_file_streaming(xml_file)
+            skip_expected = dict(skip_parser.parse_xml_file(xml_file)[root_tag])
+            if 'FlightLeg' in skip_expected:
+                flight_legs = skip_expected['FlightLeg']
+                skip_expected['FlightLeg'] = flight_legs if isinstance(flight_legs, list) else [flight_legs]
+            self.assertEqual(skip_stream, {root_tag: skip_expected},
+                             f"Streaming output with skip_tags differs for {xml_file}")
+            self.assertNotIn('TPA_Extension', json.dumps(skip_stream))
+
+        # Records between other root children, inside a skipped subtree and inside
+        # another record: streaming matches the tree parser, key order included
+        record_xml = ('<Root Id="1"><A>a</A><R N="1"><R>inner</R></R><B>b</B>'
+                      '<X><R N="x"/></X><R N="2"/></Root>')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            record_file = Path(temp_dir) / "records.xml"
+            record_file.write_text(record_xml, encoding="utf-8")
+            for options in ({'skip_tags': ['X']}, {'include_only_tags': ['A', 'B', 'R']}):
+                record_parser = _get_parser(**options)
+                tree_records = record_parser.parse_xml_file(record_file)
+                stream_records = record_parser.parse_xml_file_streaming(record_file, record_tag='R')
+                self.assertEqual(tree_records, {'Root': {'@Id': '1', 'A': 'a',
+                                                         'R': [{'@N': '1', 'R': 'inner'}, {'@N': '2'}],
+                                                         'B': 'b'}})
+                self.assertEqual(stream_records, tree_records, f"Streaming records differ ({options})")
+                self.assertEqual(list(stream_records['Root']), list(tree_records['Root']),
+                                 f"Streaming key order differs ({options})")
+
+        self._log.append(f"   ✅ Streaming parse matches tree parse for all {len(self.xml_files)} files")
+
+    @_timed
+    def test_11_batch_parse(self):
+        """
+        Test 11: Test parallel batch parsing of all XML files.
+
+        This test ensures that:
+        1. Batch parsing returns one result per input file
+        2. Results are in input order and match sequential parsing
+
+        Batch parsing distributes independent files across worker processes.
+        """
+        self._log.append("🔍 Test 11: Testing parallel batch parsing...")
+
+        # Parse all files across two worker processes
+        batch_results = parse_aidx_batch(self.xml_files, workers=2)
+
+        # Verify results match the sequential parse of each file (shared with tests 1-6), in order
+        self.assertEqual(len(batch_results), len(self.xml_files))
+        for xml_file, batch_result in zip(self.xml_files, batch_results):
+            self.assertEqual(batch_result, self._cached(xml_file, 'parsed'),
+                             f"Batch result differs for {xml_file}")
+
+        self._log.append(f"   ✅ Batch parsed {len(batch_results)} files in input order")
+
+    @_timed
+    def test_12_xml_backends(self):
+        """
+        Test 12: Test that every available XML backend produces identical output.
+
+        This test ensures that:
+        1. The standard library backend matches the default backend
+        2. Unknown backends are rejected with a clear error
+        3. Internal entities are expanded and external entities refused alike
+
+        The lxml backend is optional, so the default may already be stdlib.
+        """
+        self._log.append("🔍 Test 12: Testing XML parsing backends...")
+
+        stdlib_parser = _get_parser(backend='stdlib')
+        for xml_file in self.xml_files:
+            self.assertEqual(stdlib_parser.parse_xml_file(xml_file),
+                             self._cached(xml_file, 'parsed'),
+                             f"Backend output differs for {xml_file}")
+
+        # Unsupported backends fail fast at construction time
+        with self.assertRaises(ValueError):
+            AIDXParser(backend='pygixml')
+
+        # Text around an internal entity reference is kept by every entry point
+        internal_entity = '<!DOCTYPE r [<!ENTITY e "EXP">]><r><a>foo &e; bar</a></r>'
+        external_entity = ('<!DOCTYPE r [<!ENTITY e SYSTEM "file:///etc/hostname">]>'
+                           '<r><a>foo &e; bar</a></r>')
+        expected = {'r': {'a': 'foo EXP bar'}}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            entity_file = Path(temp_dir) / "entity.xml"
+            entity_file.write_text(internal_entity, encoding="utf-8")
+            for parser in (stdlib_parser, self.parser):
+                self.assertEqual(parser.parse_xml_string(internal_entity), expected)
+                self.assertEqual(parser.parse_xml_bytes(internal_entity.encode()), expected)
+                self.assertEqual(parser.parse_xml_stream([internal_entity.encode()]), expected)
+                self.assertEqual(parser.parse_xml_file(entity_file), expected)
+                self.assertEqual(parser.parse_xml_file_streaming(entity_file, record_tag='a'),
+                                 {'r': {'a': ['foo EXP bar']}})
+
+                # External entities are never loaded
+                with self.assertRaises(AIDXParseError):
+                    parser.parse_xml_string(external_entity)
+
+        self._log.append(f"   ✅ Backends '{stdlib_parser.backend}' and '{self.parser.backend}' agree")
+
+    @_timed
+    def test_13_chunked_stream_parse(self):
+        """
+        Test 13: Test parsing XML that arrives in chunks.
+
+        This test ensures that:
+        1. Feeding a document in chunks matches parsing it in one piece
+        2. Chunk boundaries may fall anywhere, even inside tags
+        3. Empty streams are rejected like empty strings
+        4. Raw bytes input matches parsing the file directly
+
+        Chunked parsing lets uploads be converted while they are being read.
+        """
+        self._log.append("🔍 Test 13: Testing chunked stream parsing...")
+
+        for xml_file in self.xml_files:
+            xml_bytes = xml_file.read_bytes()
+            expected = self._cached(xml_file, 'parsed')
+            self.assertEqual(self.parser.parse_xml_bytes(xml_bytes), expected,
+                             f"Bytes output differs for {xml_file}")
+
+            # Small odd-sized chunks split tags, attributes and text
+            for chunk_size in (7, 65536):
+                chunks = (xml_bytes[i:i + chunk_size] for i in range(0, len(xml_bytes), chunk_size))
+                self.assertEqual(self.parser.parse_xml_stream(chunks), expected,
+                                 f"Chunked output differs for {xml_file} (chunk size {chunk_size})")
+
+        # Empty and whitespace-only streams are errors
+        with self.assertRaises(AIDXParseError):
+            self.parser.parse_xml_stream([])
+        with self.assertRaises(AIDXParseError):
+            self.parser.parse_xml_stream([b"  ", b"\n"])
+
+        self._log.append(f"   ✅ Chunked parse matches full parse for all {len(self.xml_files)} files")
+
+    def _validate_structure_integrity(self, et_element: XMLElement, parsed_data: Dict[str, Any], filename: str):
         """
         Helper method to validate structural integrity between ElementTree and parsed data.
         
@@ -598,7 +1485,7 @@ class TestAIDXParser(unittest.TestCase):
         4. Text content is maintained
         
         Args:
-            et_element: ElementTree element (reference)
+            et_element: ElementTree or lxml element (reference)
             parsed_data: Parsed data from our parser
             filename: Name of file being validated (for error reporting)
             
@@ -618,7 +1505,8 @@ class TestAIDXParser(unittest.TestCase):
         # Additional integrity checks could be added here
         # For example: comparing element counts, attribute preservation, etc.
 
-    def _extract_flight_info(self, data: Dict[str, Any], filename: str) -> Dict[str, str]:
+    def _extract_flight_info(self, data: Dict[str, Any], filename: str,
+                             _type=type, _dict=dict, _str=str) -> FlightInfo:
         """
         Helper method to extract key flight information from parsed AIDX data.
         
@@ -632,99 +1520,147 @@ class TestAIDXParser(unittest.TestCase):
         Args:
             data: Parsed AIDX data dictionary
             filename: Name of source file (for context)
+            _type, _dict, _str: Builtins bound as defaults so the checks below
+                                read locals instead of looking up builtins
+                                (not meant to be passed)
             
         Returns:
-            Dictionary containing extracted flight information
+            FlightInfo containing extracted flight information
             
         Example return:
-            {
-                "airline": "JQ",
-                "flight_number": "255", 
-                "flight_type": "Arrival",
-                "origin": "SYD",
-                "destination": "MEL",
-                "status": "On Time"
-            }
-        """
-        # Initialize result dictionary with default values
-        flight_info = {
-            "airline": "N/A",
-            "flight_number": "N/A", 
-            "flight_type": "Unknown",
-            "origin": "N/A",
-            "destination": "N/A",
-            "status": "N/A"
-        }
+            FlightInfo(airline='JQ', flight_number='255', flight_type='Arrival',
+                       origin='SYD', destination='MEL', status='On Time',
+                       extraction_error=None)
+        """
+        # Navigate through the data structure to find flight information
+        # AIDX structure typically has a root element containing FlightLeg data.
+        # The parser builds plain dicts, so every step is guarded by an exact
+        # type check or a .get(), and nothing here needs an exception handler
+        if _type(data) is not _dict:
+            return FlightInfo()
+        
+        # Get the root element (should be only one key)
+        root_data = next(iter(data.values()), None)
+        if _type(root_data) is not _dict:
+            return FlightInfo()
+        
+        # Look for FlightLeg information (LegData when there is no FlightLeg)
+        flight_leg = root_data.get(_K_FLIGHT_LEG, root_data.get(_K_LEG_DATA))
+        if not flight_leg or _type(flight_leg) is not _dict:
+            return FlightInfo()
+        
+        # Extract airline information from LegIdentifier
+        airline = "N/A"
+        airline_data = _walk(flight_leg, _K_LEG_ID, _K_AIRLINE)
+        if _type(airline_data) is _dict:
+            # The parser only stores '#text' when there is text, so None means
+            # absent; the CodeContext fallback is looked up only when needed
+            airline = airline_data.get(_K_TEXT)
+            if airline is None:
+                airline = airline_data.get(_K_CODE_CONTEXT, 'N/A')
+        elif airline_data is not None:
+            airline = _str(airline_data)
+        
+        # Extract flight number
+        flight_number = _walk(flight_leg, _K_LEG_ID, _K_FLIGHT_NUMBER)
+        flight_number = _str(flight_number) if flight_number is not None else "N/A"
+        
+        # Determine flight type from filename (one regex scan, no lowered copy)
+        flight_type_match = _FLIGHT_TYPE_RE.search(filename)
+        flight_type = flight_type_match.group(1).capitalize() if flight_type_match else "Unknown"
+        
+        # Extract airport information and operational status
+        return FlightInfo(airline, flight_number, flight_type,
+                          **{field: _leg_field(flight_leg, key_path)
+                             for field, key_path in _FLIGHT_LEG_FIELDS})
+
+    def _extract_flight_info_stream(self, xml_file: Path) -> FlightInfo:
+        """
+        Extract the same flight information as _extract_flight_info(), straight from the XML.
         
-        try:
-            # Navigate through the data structure to find flight information
-            # AIDX structure typically has a root element containing FlightLeg data
-            
-            # Get the root element (should be only one key)
-            root_keys = list(data.keys())
-            if not root_keys:
-                return flight_info
+        The file is read with iterparse instead of being parsed into nested
+        dicts. Each top-level element is cleared once it ends, except the first
+        FlightLeg (or LegData), whose subtree is kept to read the few fields
+        used here. Memory therefore stays bounded by one leg, not the whole
+        message, and no dicts are built for the fields that are not used.
+        
+        The fixture uses this variant when AIDX_STREAM=1 is set.
+        
+        Args:
+            xml_file: Path of the AIDX XML file
             
-            root_data = data[root_keys[0]]
-            if not isinstance(root_data, dict):
-                return flight_info
+        Returns:
+            FlightInfo containing extracted flight information (same values as
+            _extract_flight_info() for the parsed file)
+        """
+        # Values found in the file replace these defaults
+        airline, flight_number, flight_type = "N/A", "N/A", "Unknown"
+        leg_fields = {}
+        extraction_error = None
+        
+        try:
+            # First element and occurrence count for each leg tag under the root
+            legs = {}
+            depth = 0
+            for event, elem in ET.iterparse(str(xml_file), events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth != 1:
+                    # Deeper elements are released with their top-level ancestor
+                    continue
+                name = _local_name(elem.tag)
+                if name in _LEG_TAGS:
+                    first, count = legs.get(name, (None, 0))
+                    legs[name] = (first if first is not None else elem, count + 1)
+                    if first is None:
+                        # Keep the first leg's subtree for extraction
+                        continue
+                elem.clear()
             
-            # Look for FlightLeg information
+            # FlightLeg wins over LegData; a repeated leg is a list in the parsed
+            # data, which yields no flight information
             flight_leg = None
-            if 'FlightLeg' in root_data:
-                flight_leg = root_data['FlightLeg']
-            elif 'LegData' in root_data:
-                flight_leg = root_data['LegData']
+            for name in _LEG_TAGS:
+                if name in legs:
+                    first, count = legs[name]
+                    flight_leg = first if count == 1 else None
+                    break
             
-            if flight_leg and isinstance(flight_leg, dict):
-                # Extract LegIdentifier information
-                if 'LegIdentifier' in flight_leg:
-                    leg_id = flight_leg['LegIdentifier']
-                    if isinstance(leg_id, dict):
-                        # Extract airline information
-                        if 'Airline' in leg_id:
-                            airline_data = leg_id['Airline']
-                            if isinstance(airline_data, dict):
-                                flight_info["airline"] = airline_data.get('#text', airline_data.get('@CodeContext', 'N/A'))
-                            else:
-                                flight_info["airline"] = str(airline_data)
-                        
-                        # Extract flight number
-                        if 'FlightNumber' in leg_id:
-                            flight_info["flight_number"] = str(leg_id['FlightNumber'])
+            if flight_leg is not None and _is_mapping(flight_leg):
+                leg_identifier = _only_child(flight_leg, _K_LEG_ID)
+                if leg_identifier is not None and _is_mapping(leg_identifier):
+                    # Airline text, falling back to its CodeContext attribute
+                    airline_elem = _only_child(leg_identifier, _K_AIRLINE)
+                    if airline_elem is not None:
+                        airline = (airline_elem.text or '').strip()
+                        if _is_mapping(airline_elem) and not airline:
+                            airline = airline_elem.get('CodeContext', 'N/A')
+                    
+                    # Flight number is a plain text element
+                    number_elem = _only_child(leg_identifier, _K_FLIGHT_NUMBER)
+                    if number_elem is not None and not _is_mapping(number_elem):
+                        flight_number = (number_elem.text or '').strip()
                 
-                # Determine flight type from filename or data structure
-                filename_lower = filename.lower()
-                if 'arrival' in filename_lower:
-                    flight_info["flight_type"] = "Arrival"
-                elif 'departure' in filename_lower:
-                    flight_info["flight_type"] = "Departure"
+                # Determine flight type from filename (one regex scan, no lowered copy)
+                flight_type_match = _FLIGHT_TYPE_RE.search(xml_file.name)
+                if flight_type_match:
+                    flight_type = flight_type_match.group(1).capitalize()
                 
-                # Extract airport information
-                if 'DepartureAirport' in flight_leg:
-                    dep_airport = flight_leg['DepartureAirport']
-                    if isinstance(dep_airport, dict) and '@LocationCode' in dep_airport:
-                        flight_info["origin"] = dep_airport['@LocationCode']
-                
-                if 'ArrivalAirport' in flight_leg:
-                    arr_airport = flight_leg['ArrivalAirport']
-                    if isinstance(arr_airport, dict) and '@LocationCode' in arr_airport:
-                        flight_info["destination"] = arr_airport['@LocationCode']
-                
-                # Extract operational status
-                if 'LegData' in flight_leg:
-                    leg_data = flight_leg['LegData']
-                    if isinstance(leg_data, dict):
-                        if 'OperationalStatus' in leg_data:
-                            op_status = leg_data['OperationalStatus']
-                            if isinstance(op_status, dict) and '@Code' in op_status:
-                                flight_info["status"] = op_status['@Code']
+                # Extract airport information and operational status
+                for field, key_path in _FLIGHT_LEG_FIELDS:
+                    value = _walk_element(flight_leg, key_path)
+                    leg_fields[field] = value if value is not None else 'N/A'
         
         except Exception as e:
-            # If extraction fails, log the error but don't fail the test
-            flight_info["extraction_error"] = str(e)
+            # If extraction fails, keep the error but don't fail the test. It is
+            # stored unformatted, without its traceback (which would keep the
+            # parse frames and elements alive)
+            extraction_error = e.with_traceback(None)
         
-        return flight_info
+        return FlightInfo(airline, flight_number, flight_type,
+                          extraction_error=extraction_error, **leg_fields)
 
     @classmethod
     def tearDownClass(cls):
@@ -734,17 +1670,65 @@ class TestAIDXParser(unittest.TestCase):
         This method:
         1. Generates a summary report of all test results
         2. Displays statistics about parsed files
-        3. Shows extracted flight data summary
+        3. Shows how long each test took, slowest first
         4. Provides final test suite status
         
         This runs once after all tests in the class have completed.
         """
-        print(f"\n{'='*80}")
-        print(f"TEST SUITE COMPLETED")
-        print(f"{'='*80}")
-        print(f"Total XML files tested: {len(cls.xml_files)}")
-        print(f"Test folder: {cls.xml_folder.absolute()}")
-        print(f"{'='*80}\n")
+        # Build the whole report and write it in one call
+        report = [
+            f"\n{_BAR}",
+            "TEST SUITE COMPLETED",
+            _BAR,
+            f"Total XML files tested: {len(cls.xml_files)}",
+            f"Test folder: {cls.xml_folder_abs}",
+            '-' * 80,
+        ]
+        for test_name, elapsed in sorted(cls._timings.items(), key=lambda item: item[1], reverse=True):
+            report.append(f"   ⏱️  {test_name}: {elapsed:.3f}s")
+        report.append(f"{_BAR}\n\n")
+        sys.stdout.write('\n'.join(report))
+
+
+class _QuietTestResult(unittest.TextTestResult):
+    """
+    Test result that reports only problems while the suite runs.
+    
+    Each test already writes its own report (see _timed), so the runner's
+    per-test "test_name ... ok" lines are not formatted or written. Failures
+    and errors are named as they happen, and their tracebacks are printed in
+    the summary at the end as usual.
+    """
+    
+    def startTest(self, test):
+        # Count the test without writing its description
+        unittest.TestResult.startTest(self, test)
+    
+    def addSuccess(self, test):
+        unittest.TestResult.addSuccess(self, test)
+    
+    def addSkip(self, test, reason):
+        unittest.TestResult.addSkip(self, test, reason)
+    
+    def addError(self, test, err):
+        unittest.TestResult.addError(self, test, err)
+        self.stream.writeln(f"ERROR: {self.getDescription(test)}")
+        self.stream.flush()
+    
+    def addFailure(self, test, err):
+        unittest.TestResult.addFailure(self, test, err)
+        self.stream.writeln(f"FAIL: {self.getDescription(test)}")
+        self.stream.flush()
+
+
+# Test loader and runner are stateless between runs, so they are built once
+_LOADER = unittest.TestLoader()
+_RUNNER = unittest.TextTestRunner(
+    verbosity=1,                    # Summary output; tests print their own reports
+    stream=sys.stdout,              # Output to console
+    buffer=False,                   # Don't buffer output
+    resultclass=_QuietTestResult    # Only failures and errors are reported inline
+)
 
 
 def run_comprehensive_test():
@@ -763,17 +1747,10 @@ def run_comprehensive_test():
     This function can be called directly or used as a script entry point.
     """
     # Create test suite
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestAIDXParser)
-    
-    # Run tests with detailed output
-    runner = unittest.TextTestRunner(
-        verbosity=2,           # Detailed output
-        stream=sys.stdout,     # Output to console
-        buffer=False           # Don't buffer output
-    )
+    suite = _LOADER.loadTestsFromTestCase(TestAIDXParser)
     
     # Execute the test suite
-    result = runner.run(suite)
+    result = _RUNNER.run(suite)
     
     # Return success status
     return result.wasSuccessful()